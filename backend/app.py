@@ -11,27 +11,40 @@ This condition is binding and must be preserved in all versions.
 """
 
 import csv
+import hashlib
 import io
 import json
 import logging
 import os
+import secrets
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from functools import wraps
+from itertools import chain, islice
 
+import orjson
 import pytz
 from dateutil import parser as dateutil_parser
 from flask import (Flask, Response, g, jsonify, redirect, render_template,
-                   request, session, url_for)
+                   request, session, stream_with_context, url_for)
+from flask.json.provider import DefaultJSONProvider
 from flask_babel import Babel
+from flask_compress import Compress
 from flask_cors import CORS
 from flask_jwt_extended import (JWTManager, create_access_token,
                                 get_jwt_identity, jwt_required)
 from flask_sqlalchemy import SQLAlchemy
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event, lambda_stmt, select, update
+from sqlalchemy.orm import configure_mappers, selectinload
 from werkzeug.security import check_password_hash, generate_password_hash
 
-from utils.export import (export_data_csv, export_data_excel, export_data_pdf,
-                          export_system_report)
+from utils.export import (export_data_excel, export_data_pdf,
+                          export_system_report, stream_data_csv)
 from utils.rs485 import (close_locker, get_locker_status, open_locker,
                          test_rs485_connection)
 
@@ -83,14 +96,46 @@ DB_NAME = os.environ.get("DB_NAME", "smart_locker")
 DB_USER = os.environ.get("DB_USER", "postgres")
 DB_PASSWORD = os.environ.get("DB_PASSWORD", "postgres")
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson
+
+    Output matches the default provider's: keys are sorted, and dates and
+    the other types orjson does not encode itself go through the default
+    provider's converter (so datetimes stay HTTP dates).
+    """
+
+    def _options(self):
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options()),
+            mimetype=self.mimetype,
+        )
+
+
 # Initialize Flask application
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configuration
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", os.urandom(32).hex())
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 app.config["JWT_SECRET_KEY"] = os.environ.get("JWT_SECRET_KEY", "smart-locker-jwt-secret-key-2024")
 app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=24)
+# Templates are only re-read on restart; compiled ones are cached on disk
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 
 # Security headers
@@ -129,15 +174,79 @@ if not database_url.startswith("postgresql://"):
     sys.exit(1)
 
 app.config["SQLALCHEMY_DATABASE_URI"] = database_url
+# Connection pool sizing - concurrent requests (and parallel test workers)
+# each check out their own connection instead of queueing on a single one
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_size": int(os.environ.get("DB_POOL_SIZE", "10")),
+    "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "20")),
     "pool_pre_ping": True,
     "pool_recycle": 300,
 }
+# Optional per-connection server settings, e.g. DB_SYNCHRONOUS_COMMIT=off to
+# stop waiting on the WAL flush at every commit (a server crash may then lose
+# the last fraction of a second of commits, but never corrupts data)
+_pg_options = " ".join(
+    f"-c {name}={value}"
+    for name, value in (
+        ("synchronous_commit", os.environ.get("DB_SYNCHRONOUS_COMMIT")),
+        ("work_mem", os.environ.get("DB_WORK_MEM")),
+    )
+    if value
+)
+if _pg_options:
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"]["connect_args"] = {"options": _pg_options}
+
+
+class CachingJWTManager(JWTManager):
+    """JWTManager that remembers the tokens it has already verified
+
+    Clients send the same bearer token on every request until it expires,
+    so after one full check its claims are served from an LRU keyed by the
+    token's digest, skipping the signature check and JSON parsing. Entries
+    are only used before the token's exp claim.
+    """
+
+    cache_size = 10000
+
+    def __init__(self, app=None):
+        self._verified = OrderedDict()
+        self._verified_lock = threading.Lock()
+        super().__init__(app)
+
+    def _decode_jwt_from_config(
+        self, encoded_token, csrf_value=None, allow_expired=False
+    ):
+        if csrf_value or allow_expired:
+            return super()._decode_jwt_from_config(
+                encoded_token, csrf_value, allow_expired
+            )
+
+        key = hashlib.sha256(encoded_token.encode()).digest()[:16]
+        with self._verified_lock:
+            entry = self._verified.get(key)
+            if entry is not None and time.time() < entry[0]:
+                self._verified.move_to_end(key)
+                return dict(entry[1])
+
+        claims = super()._decode_jwt_from_config(encoded_token)
+        if "exp" in claims:
+            with self._verified_lock:
+                self._verified[key] = (claims["exp"], dict(claims))
+                if len(self._verified) > self.cache_size:
+                    self._verified.popitem(last=False)
+        return claims
+
 
 # Initialize extensions
 db = SQLAlchemy(app)
-jwt = JWTManager(app)
+jwt = CachingJWTManager(app)
 CORS(app)
+Compress(app)
+# Flask-Compress defaults plus CSV exports, which shrink several-fold
+app.config["COMPRESS_MIMETYPES"] = [*app.config["COMPRESS_MIMETYPES"], "text/csv"]
+# Streamed responses (the CSV exports) must go out as they are produced;
+# compressing them would buffer the whole body in memory first
+app.config["COMPRESS_STREAMS"] = False
 
 
 # JWT error handlers
@@ -179,21 +288,24 @@ def expired_token_callback(jwt_header, jwt_payload):
     return jsonify({"error": "Token has expired"}), 401
 
 
-# Initialize Babel
-babel = Babel(app)
-
 # Babel configuration
 app.config["BABEL_DEFAULT_LOCALE"] = "en"
 app.config["BABEL_SUPPORTED_LOCALES"] = ["en", "fr", "es", "tr"]
+SUPPORTED_LOCALES = frozenset(app.config["BABEL_SUPPORTED_LOCALES"])
 
 
 def get_locale():
-    """Get the locale for the current request"""
-    # Try to get locale from session
-    if "language" in session:
-        return session["language"]
-    # Try to get locale from request
-    return request.accept_languages.best_match(app.config["BABEL_SUPPORTED_LOCALES"])
+    """Get the locale for the current request, resolved once per request"""
+    if "locale" not in g:
+        # Try to get locale from session, then from the request
+        g.locale = session.get("language") or request.accept_languages.best_match(
+            app.config["BABEL_SUPPORTED_LOCALES"]
+        )
+    return g.locale
+
+
+# Initialize Babel
+babel = Babel(app, locale_selector=get_locale)
 
 
 # Import and initialize models from models.py
@@ -222,6 +334,104 @@ app.config["models"] = {
     "Reservation": Reservation,
 }
 
+# Resolve the backref relationships (Borrow.user, Log.item, ...) now so the
+# eager-loading options below can refer to them
+configure_mappers()
+
+# Related rows the report/export views read for every borrow or log, loaded
+# with one extra IN query per relationship instead of one query per row
+BORROW_RELATIONS = (
+    selectinload(Borrow.user),
+    selectinload(Borrow.item),
+    selectinload(Borrow.locker),
+)
+LOG_RELATIONS = (
+    selectinload(Log.user),
+    selectinload(Log.item),
+    selectinload(Log.locker),
+)
+
+# Statements behind the hot list endpoints. Built as lambda statements so
+# SQLAlchemy caches their compiled SQL instead of rebuilding it per request.
+# The list endpoints select plain columns in the to_dict() shape so rows are
+# serialized directly without loading ORM instances
+ITEMS_STMT = lambda_stmt(
+    lambda: select(
+        Item.id,
+        Item.name,
+        Item.description,
+        Item.category,
+        Item.condition,
+        Item.status,
+        Item.locker_id,
+        Locker.name.label("locker_name"),
+        Item.is_active,
+        Item.created_at,
+    )
+    .outerjoin(Locker, Item.locker_id == Locker.id)
+    .order_by(Item.id)
+)
+LOCKERS_STMT = lambda_stmt(
+    lambda: select(
+        Locker.id,
+        Locker.name,
+        Locker.number,
+        Locker.location,
+        Locker.description,
+        Locker.status,
+        Locker.capacity,
+        Locker.current_occupancy,
+        Locker.is_active,
+        Locker.rs485_address,
+        Locker.rs485_locker_number,
+        Locker.created_at,
+    ).order_by(Locker.name)
+)
+
+# Keep Locker.status in step with reservations: lockers with any active
+# reservation (including future ones) are "reserved", the rest fall back
+# to "active"
+_RESERVED_LOCKER_IDS = select(Reservation.locker_id).where(
+    Reservation.status == "active"
+)
+MARK_RESERVED_LOCKERS_STMT = (
+    update(Locker)
+    .where(
+        Locker.id.in_(_RESERVED_LOCKER_IDS),
+        Locker.status.is_distinct_from("reserved"),
+    )
+    .values(status="reserved")
+    .execution_options(synchronize_session=False)
+)
+RELEASE_UNRESERVED_LOCKERS_STMT = (
+    update(Locker)
+    .where(Locker.id.not_in(_RESERVED_LOCKER_IDS), Locker.status == "reserved")
+    .values(status="active")
+    .execution_options(synchronize_session=False)
+)
+
+
+def recent_activity_stmt(limit):
+    """Latest logs with their username; limit is sent as a bound parameter"""
+    return lambda_stmt(
+        lambda: select(Log, User.username)
+        .outerjoin(User, Log.user_id == User.id)
+        .order_by(Log.timestamp.desc())
+        .limit(limit)
+    )
+
+# Serialized /api/user/profile bodies by user id, as (expires_at, body). Kept
+# short-lived because other workers may change the row behind our back
+PROFILE_CACHE_SECONDS = 30
+_profile_cache = {}
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _drop_cached_profile(mapper, connection, target):
+    """Forget a user's cached profile as soon as this process changes it"""
+    _profile_cache.pop(target.id, None)
+
 # Remove the duplicate User model definition from app.py. Only use the User model from models.py via init_models(db).
 # They will be imported from models.py when needed
 
@@ -261,79 +471,331 @@ def log_action(
 
 
 def admin_required(fn):
+    """Allow only admins; the checked user is left on g.current_user
+
+    The role is read from the database on every request and never cached,
+    so demoting or deleting an admin takes effect in every worker at once.
+    """
+
     @wraps(fn)
     def wrapper(*args, **kwargs):
         current_user_id = get_jwt_identity()
         user = db.session.get(User, current_user_id)
         if not user or user.role != "admin":
             return jsonify({"error": "Admin access required"}), 403
+        g.current_user = user
         return fn(*args, **kwargs)
 
     return wrapper
 
 
+def ttl_cached(seconds):
+    """Serve a view's last successful response for a few seconds
+
+    Meant for argument-free views such as the admin stats, whose payload
+    changes slowly but would otherwise hit the database on every poll.
+    """
+
+    def decorator(fn):
+        cache = {}
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            entry = cache.get("entry")
+            if entry and time.monotonic() - entry[0] < seconds:
+                return Response(entry[1], status=200, mimetype="application/json")
+            response = app.make_response(fn(*args, **kwargs))
+            if response.status_code == 200:
+                cache["entry"] = (time.monotonic(), response.get_data())
+            return response
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+# Admin stats are cached for this long. Commits in this process that touch
+# the counted tables drop the cached copy at once; other workers' changes
+# show up within the TTL
+STATS_CACHE_SECONDS = 30
+
+# Serialized /api/items and /api/lockers bodies, as name -> (version,
+# built_at, body). A commit in this process that touches a list's models
+# bumps its version; other workers' changes show up within the TTL
+LIST_CACHE_SECONDS = 10
+_list_versions = {"items": 0, "lockers": 0}
+_list_cache = {}
+
+# Models whose committed changes invalidate each cached view
+CACHED_VIEW_MODELS = {
+    "stats": (User, Locker, Item, Borrow),
+    "items": (Item, Locker),
+    "lockers": (Locker, Reservation),
+}
+
+
+def cached_list_body(name, build):
+    """Return the cached body of a list view, calling build() when stale"""
+    version = _list_versions[name]
+    entry = _list_cache.get(name)
+    now = time.monotonic()
+    if entry and entry[0] == version and now - entry[1] < LIST_CACHE_SECONDS:
+        return entry[2]
+    body = build()
+    _list_cache[name] = (version, now, body)
+    return body
+
+
+def borrow_counts_by(column):
+    """Return {id: (total_borrows, active_borrows)} grouped on a Borrow column"""
+    rows = (
+        db.session.query(
+            column,
+            db.func.count(Borrow.id),
+            db.func.sum(db.case((Borrow.returned_at.is_(None), 1), else_=0)),
+        )
+        .group_by(column)
+        .all()
+    )
+    return {key: (total, active or 0) for key, total, active in rows}
+
+
+# How far back ?range= reaches when a report request gives no explicit dates
+REPORT_RANGES = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+
+def report_date_range(args):
+    """Return (start, end) datetimes from the start_date/end_date query args
+
+    Dates are YYYY-MM-DD. Either bound may be None; the end date includes
+    the whole of that day. Without either date, an explicit range (day,
+    week, month, year) selects that period up to now.
+    """
+    start_date = args.get("start_date")
+    end_date = args.get("end_date")
+    if start_date:
+        start_date = datetime.combine(date.fromisoformat(start_date), datetime.min.time())
+    if end_date:
+        end_date = datetime.combine(date.fromisoformat(end_date), datetime.max.time())
+    if not start_date and not end_date and args.get("range") in REPORT_RANGES:
+        end_date = datetime.utcnow()
+        start_date = end_date - REPORT_RANGES[args["range"]]
+    return start_date or None, end_date or None
+
+
+def transactions_between_stmt(start_date, end_date):
+    """Borrows taken out or returned within [start_date, end_date]
+
+    This is the usual report request (the Reports page always sends both
+    dates), so its statement is cached with the dates as bound parameters.
+    """
+    return lambda_stmt(
+        lambda: select(Borrow)
+        .options(*BORROW_RELATIONS)
+        .where(
+            db.or_(
+                Borrow.borrowed_at.between(start_date, end_date),
+                Borrow.returned_at.between(start_date, end_date),
+            )
+        )
+    )
+
+
+# Rows fetched and formatted at a time when streaming a CSV export
+EXPORT_BATCH_SIZE = 500
+
+# Excel/PDF exports requested with ?async=1 are built on these threads. Each
+# job is a <job_id>.json status file plus its <job_id>.out file in EXPORT_DIR,
+# so whichever worker process gets the poll can answer it. Files are removed
+# once downloaded, or EXPORT_JOB_TTL seconds after the job finished
+export_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+EXPORT_JOB_TTL = 600
+EXPORT_DIR = os.environ.get("EXPORT_DIR", os.path.join(BASE_DIR, "exports"))
+os.makedirs(EXPORT_DIR, exist_ok=True)
+
+
+def export_job_path(job_id, suffix):
+    return os.path.join(EXPORT_DIR, f"{job_id}{suffix}")
+
+
+def write_export_job(job_id, job):
+    """Replace a job's status file in one step, so readers never see half of it"""
+    tmp_path = export_job_path(job_id, f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(job))
+    os.replace(tmp_path, export_job_path(job_id, ".json"))
+
+
+def read_export_job(job_id):
+    try:
+        with open(export_job_path(job_id, ".json"), "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return None
+
+
+def remove_export_job(job_id):
+    for suffix in (".json", ".out"):
+        try:
+            os.remove(export_job_path(job_id, suffix))
+        except FileNotFoundError:
+            pass
+
+
+def prune_export_jobs():
+    """Remove jobs that finished more than EXPORT_JOB_TTL seconds ago"""
+    cutoff = time.time() - EXPORT_JOB_TTL
+    with os.scandir(EXPORT_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            job_id = entry.name[: -len(".json")]
+            try:
+                finished = entry.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            job = read_export_job(job_id)
+            if job is not None and job["status"] != "pending" and finished < cutoff:
+                remove_export_job(job_id)
+
+
+def _build_export_file(job_id, job, query, data_formatter, build):
+    """Run an export query and write out the file (export thread)"""
+    try:
+        with app.app_context():
+            content = build(data_formatter(query.with_session(db.session()).all()))
+        with open(export_job_path(job_id, ".out"), "wb") as f:
+            f.write(content)
+        job["status"] = "done"
+    except Exception as e:
+        logger.error(f"Export job {job_id} error: {e}")
+        job["status"] = "error"
+    write_export_job(job_id, job)
+
+
+def submit_export_job(query, data_formatter, build, filename, mimetype):
+    """Start building an export in the background and return its job id"""
+    prune_export_jobs()
+    job_id = secrets.token_urlsafe(16)
+    job = {"status": "pending", "filename": filename, "mimetype": mimetype}
+    write_export_job(job_id, job)
+    export_executor.submit(_build_export_file, job_id, job, query, data_formatter, build)
+    return job_id
+
+
+def log_stream_errors(lines, data_type):
+    """Pass a streamed export through, logging an error that cuts it short
+
+    The response has already started by then, so the error is re-raised
+    to abort the transfer rather than end the file as if it were complete.
+    """
+    try:
+        yield from lines
+    except Exception as e:
+        logger.error(f"Export {data_type} error while streaming: {e}")
+        raise
+
+
 def common_export(data_type, query_func, data_formatter):
-    """Common export function for all data types"""
+    """Common export function for all data types
+
+    query_func returns the (unexecuted) query to export; data_formatter
+    turns a list of its rows into a list of dicts.
+    """
     try:
         format_type = request.args.get("format", "csv").lower()
         
         # Get the data using the provided query function
-        raw_data = query_func()
-        
-        # Format the data using the provided formatter
-        formatted_data = data_formatter(raw_data)
+        query = query_func()
         
         # Generate filename
         filename_base = f"{data_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         if format_type == "csv":
-            csv_content = export_data_csv(formatted_data)
+            # Stream the file: fetch and format the rows in batches and send
+            # each line as it is written instead of building it in memory
+            rows = iter(query.yield_per(EXPORT_BATCH_SIZE))
+            batches = iter(lambda: list(islice(rows, EXPORT_BATCH_SIZE)), [])
+            formatted_rows = chain.from_iterable(map(data_formatter, batches))
             return Response(
-                csv_content,
+                stream_with_context(
+                    log_stream_errors(stream_data_csv(formatted_rows), data_type)
+                ),
                 mimetype="text/csv",
                 headers={"Content-Disposition": f"attachment; filename={filename_base}.csv"},
             )
-        elif format_type == "excel":
-            excel_content = export_data_excel(formatted_data)
-            return Response(
-                excel_content,
-                mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": f"attachment; filename={filename_base}.xlsx"},
-            )
+
+        if format_type == "excel":
+            build = export_data_excel
+            mimetype = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            filename = f"{filename_base}.xlsx"
         elif format_type == "pdf":
-            sections = [{"title": f"{data_type.title()} Report", "content": formatted_data}]
-            pdf_content = export_data_pdf(f"Smart Locker {data_type.title()} Report", sections)
-            return Response(
-                pdf_content,
-                mimetype="application/pdf",
-                headers={"Content-Disposition": f"attachment; filename={filename_base}.pdf"},
-            )
+            def build(formatted_data):
+                sections = [{"title": f"{data_type.title()} Report", "content": formatted_data}]
+                return export_data_pdf(f"Smart Locker {data_type.title()} Report", sections)
+            mimetype = "application/pdf"
+            filename = f"{filename_base}.pdf"
         else:
             return jsonify({"error": "Unsupported format. Use csv, excel, or pdf"}), 400
 
+        if request.args.get("async", "").lower() in ("1", "true"):
+            job_id = submit_export_job(query, data_formatter, build, filename, mimetype)
+            return (
+                jsonify(
+                    {
+                        "job_id": job_id,
+                        "status_url": url_for("get_export_job", job_id=job_id),
+                    }
+                ),
+                202,
+            )
+
+        # Format the data using the provided formatter
+        formatted_data = data_formatter(query.all())
+        return Response(
+            build(formatted_data),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
+
     except Exception as e:
         logger.error(f"Export {data_type} error: {e}")
         return jsonify({"error": "Internal server error"}), 500
 
 
 # Routes
-@app.before_request
-def before_request():
+@app.context_processor
+def inject_locale():
     """
-    Set up global variables before each request.
+    Make sure g.locale is set before a template that reads it is rendered.
+    API requests never resolve the locale.
     """
-    g.locale = get_locale()
+    get_locale()
+    return {}
 
 
 # --- Language selection ---
 @app.route("/language/<language>")
 def set_language(language):
-    if language in app.config["BABEL_SUPPORTED_LOCALES"]:
+    if language in SUPPORTED_LOCALES:
         session["language"] = language
     return redirect(request.referrer or url_for("main_menu"))
 
 
 # --- Auth routes ---
+
+# Fixed response bodies, encoded once. Each request still gets its own
+# Response because the after_request hooks (CORS, compression) modify it
+LOGIN_ENDPOINT_BODY = orjson.dumps({"message": "Login endpoint"})
+LOGOUT_BODY = orjson.dumps({"message": "Logged out successfully"})
+
+
 @app.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
@@ -412,7 +874,7 @@ def login():
             logger.error(f"Login error: {e}")
             return jsonify({"error": "Internal server error"}), 500
     # Optionally handle GET requests here
-    return jsonify({"message": "Login endpoint"})
+    return Response(LOGIN_ENDPOINT_BODY, mimetype="application/json")
 
 
 @app.route("/api/auth/logout", methods=["POST"])
@@ -427,7 +889,7 @@ def api_logout():
         ip_address=request.remote_addr,
         user_agent=request.headers.get('User-Agent')
     )
-    return jsonify({"message": "Logged out successfully"}), 200
+    return Response(LOGOUT_BODY, mimetype="application/json")
 
 
 @app.route("/api/auth/simulate-rfid", methods=["POST"])
@@ -759,36 +1221,19 @@ def get_user(user_id):
 @jwt_required()
 def get_lockers():
     try:
-        # Sort lockers by name to maintain consistent order
-        lockers = Locker.query.order_by(Locker.name).all()
-        logger.info(f"Found {len(lockers)} lockers")
-
-        # Get current time for checking active reservations
-        now = datetime.utcnow()
-
-        for locker in lockers:
-            # Check if locker has any active reservations (including future ones)
-            active_reservation = Reservation.query.filter(
-                Reservation.locker_id == locker.id, Reservation.status == "active"
-            ).first()
-
-            # Update locker status based on reservations
-            if active_reservation:
-                if locker.status != "reserved":
-                    locker.status = "reserved"
-            else:
-                # If no active reservation but status is reserved, make it available
-                if locker.status == "reserved":
-                    locker.status = "active"
-
-            logger.info(
-                f"Locker: {locker.name} - {locker.number} - Status: {locker.status}"
-            )
-
-        # Commit the status changes
-        db.session.commit()
-
-        return jsonify([locker.to_dict() for locker in lockers])
+        def build():
+            db.session.execute(MARK_RESERVED_LOCKERS_STMT)
+            db.session.execute(RELEASE_UNRESERVED_LOCKERS_STMT)
+            db.session.commit()
+
+            # Sort lockers by name to maintain consistent order
+            lockers = db.session.execute(LOCKERS_STMT).mappings().all()
+            logger.info(f"Found {len(lockers)} lockers")
+            return orjson.dumps([dict(locker) for locker in lockers])
+
+        return Response(
+            cached_list_body("lockers", build), mimetype="application/json"
+        )
     except Exception as e:
         logger.error(f"Get lockers error: {e}")
         return jsonify({"error": "Internal server error"}), 500
@@ -798,8 +1243,11 @@ def get_lockers():
 @jwt_required()
 def get_items():
     try:
-        items = Item.query.all()
-        return jsonify([item.to_dict() for item in items])
+        def build():
+            items = db.session.execute(ITEMS_STMT).mappings()
+            return orjson.dumps([dict(item) for item in items])
+
+        return Response(cached_list_body("items", build), mimetype="application/json")
     except Exception as e:
         logger.error(f"Get items error: {e}")
         return jsonify({"error": "Internal server error"}), 500
@@ -938,7 +1386,8 @@ def get_logs():
 
         query = Log.query
         if action_type:
-            query = query.filter_by(action_type=action_type)
+            # Accept a comma-separated list, e.g. "login,logout"
+            query = query.filter(Log.action_type.in_(action_type.split(",")))
         if user_id:
             query = query.filter_by(user_id=user_id)
 
@@ -962,13 +1411,29 @@ def get_logs():
 @app.route("/api/admin/stats", methods=["GET"])
 @jwt_required()
 @admin_required
+@ttl_cached(STATS_CACHE_SECONDS)
 def get_stats():
     try:
-        total_users = User.query.count()
-        total_lockers = Locker.query.count()
-        total_items = Item.query.count()
-        active_borrows = Borrow.query.filter_by(status="borrowed").count()
-        available_items = Item.query.filter_by(status="available").count()
+        # All five counts in one round trip, as scalar subqueries
+        (
+            total_users,
+            total_lockers,
+            total_items,
+            active_borrows,
+            available_items,
+        ) = db.session.execute(
+            db.select(
+                db.select(db.func.count(User.id)).scalar_subquery(),
+                db.select(db.func.count(Locker.id)).scalar_subquery(),
+                db.select(db.func.count(Item.id)).scalar_subquery(),
+                db.select(db.func.count(Borrow.id))
+                .where(Borrow.status == "borrowed")
+                .scalar_subquery(),
+                db.select(db.func.count(Item.id))
+                .where(Item.status == "available")
+                .scalar_subquery(),
+            )
+        ).one()
         return jsonify(
             {
                 "total_users": total_users,
@@ -983,6 +1448,31 @@ def get_stats():
         return jsonify({"error": "Internal server error"}), 500
 
 
+@event.listens_for(db.session, "after_flush")
+def _note_cached_view_changes(session, flush_context):
+    """Remember which cached views this transaction's changes affect"""
+    changed = session.info.setdefault("cached_view_changes", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        for name, models in CACHED_VIEW_MODELS.items():
+            if isinstance(obj, models):
+                changed.add(name)
+
+
+@event.listens_for(db.session, "after_commit")
+def _drop_cached_views(session):
+    """Drop this process's cached copies once such a change is committed"""
+    for name in session.info.pop("cached_view_changes", ()):
+        if name == "stats":
+            get_stats.cache_clear()
+        else:
+            _list_versions[name] += 1
+
+
+@event.listens_for(db.session, "after_rollback")
+def _forget_cached_view_changes(session):
+    session.info.pop("cached_view_changes", None)
+
+
 
 
 
@@ -1358,28 +1848,16 @@ def get_reports():
     """Generate reports for admin dashboard"""
     try:
         report_type = request.args.get("type", "transactions")
-        start_date = request.args.get("start_date")
-        end_date = request.args.get("end_date")
-        date_range = request.args.get("range", "week")
-
-        # Parse dates
-        if start_date:
-            start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        if end_date:
-            end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        start_date, end_date = report_date_range(request.args)
 
         # Generate report data based on type
         if report_type == "transactions":
             # Get all borrows that have either borrow_date or return_date within the range
-            query = Borrow.query
+            query = Borrow.query.options(*BORROW_RELATIONS)
             if start_date and end_date:
-                # Include transactions where either borrow_date or return_date is within range
-                query = query.filter(
-                    db.or_(
-                        db.and_(Borrow.borrowed_at >= start_date, Borrow.borrowed_at <= end_date),
-                        db.and_(Borrow.returned_at >= start_date, Borrow.returned_at <= end_date)
-                    )
-                )
+                query = db.session.execute(
+                    transactions_between_stmt(start_date, end_date)
+                ).scalars()
             elif start_date:
                 query = query.filter(
                     db.or_(
@@ -1394,44 +1872,38 @@ def get_reports():
                         Borrow.returned_at <= end_date
                     )
                 )
-            all_transactions = query.all()
-            # Separate into borrows and returns
-            borrows = []
-            returns = []
-            for transaction in all_transactions:
-                if transaction.returned_at is not None:
-                    returns.append(transaction)
-                else:
-                    borrows.append(transaction)
-            # Prepare transaction data
+            # Build the rows and the summary counts in a single pass
             transactions = []
-            for borrow in borrows:
-                transactions.append({
-                    "id": borrow.id,
-                    "user": f"{borrow.user.first_name} {borrow.user.last_name}" if borrow.user else "Unknown",
-                    "item": borrow.item.name if borrow.item else "Unknown",
-                    "action": "borrow",
-                    "timestamp": borrow.borrowed_at.isoformat() if borrow.borrowed_at else "",
-                    "locker": borrow.locker.name if borrow.locker else "Unknown"
-                })
-            for borrow in returns:
+            returns = 0
+            users = set()
+            items = set()
+            for borrow in query:
+                returned = borrow.returned_at is not None
+                if returned:
+                    returns += 1
+                    moment = borrow.returned_at
+                else:
+                    moment = borrow.borrowed_at
+                user = f"{borrow.user.first_name} {borrow.user.last_name}" if borrow.user else "Unknown"
+                item = borrow.item.name if borrow.item else "Unknown"
+                users.add(user)
+                items.add(item)
                 transactions.append({
                     "id": borrow.id,
-                    "user": f"{borrow.user.first_name} {borrow.user.last_name}" if borrow.user else "Unknown",
-                    "item": borrow.item.name if borrow.item else "Unknown",
-                    "action": "return",
-                    "timestamp": borrow.returned_at.isoformat() if borrow.returned_at else "",
+                    "user": user,
+                    "item": item,
+                    "action": "return" if returned else "borrow",
+                    "timestamp": moment.isoformat() if moment else "",
                     "locker": borrow.locker.name if borrow.locker else "Unknown"
                 })
             # Sort by timestamp
             transactions.sort(key=lambda x: x["timestamp"], reverse=True)
-            # Calculate summary
             summary = {
                 "total_transactions": len(transactions),
-                "borrows": len(borrows),
-                "returns": len(returns),
-                "unique_users": len(set(t["user"] for t in transactions)),
-                "unique_items": len(set(t["item"] for t in transactions))
+                "borrows": len(transactions) - returns,
+                "returns": returns,
+                "unique_users": len(users),
+                "unique_items": len(items)
             }
             return jsonify({
                 "summary": summary,
@@ -1443,9 +1915,9 @@ def get_reports():
             users = User.query.all()
             user_stats = []
             
+            borrow_counts = borrow_counts_by(Borrow.user_id)
             for user in users:
-                borrow_count = Borrow.query.filter_by(user_id=user.id).count()
-                active_borrows = Borrow.query.filter_by(user_id=user.id, return_date=None).count()
+                borrow_count, active_borrows = borrow_counts.get(user.id, (0, 0))
                 
                 user_stats.append({
                     "id": user.id,
@@ -1470,9 +1942,9 @@ def get_reports():
             items = Item.query.all()
             item_stats = []
             
+            borrow_counts = borrow_counts_by(Borrow.item_id)
             for item in items:
-                borrow_count = Borrow.query.filter_by(item_id=item.id).count()
-                active_borrows = Borrow.query.filter_by(item_id=item.id, return_date=None).count()
+                borrow_count, active_borrows = borrow_counts.get(item.id, (0, 0))
                 
                 item_stats.append({
                     "id": item.id,
@@ -1508,20 +1980,12 @@ def export_report():
     try:
         report_type = request.args.get("type", "transactions")
         format_type = request.args.get("format", "excel")
-        start_date = request.args.get("start_date")
-        end_date = request.args.get("end_date")
-        date_range = request.args.get("range", "week")
-
-        # Parse dates
-        if start_date:
-            start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        if end_date:
-            end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        start_date, end_date = report_date_range(request.args)
 
         # Generate report data based on type
         if report_type == "transactions":
             # Get borrows and returns
-            query = Borrow.query
+            query = Borrow.query.options(*BORROW_RELATIONS)
             if start_date:
                 query = query.filter(Borrow.borrowed_at >= start_date)
             if end_date:
@@ -1530,7 +1994,9 @@ def export_report():
             borrows = query.all()
             
             # Get returns
-            returns_query = Borrow.query.filter(Borrow.returned_at.isnot(None))
+            returns_query = Borrow.query.options(*BORROW_RELATIONS).filter(
+                Borrow.returned_at.isnot(None)
+            )
             if start_date:
                 returns_query = returns_query.filter(Borrow.returned_at >= start_date)
             if end_date:
@@ -1586,9 +2052,8 @@ def export_report():
                     headers={"Content-Disposition": f"attachment; filename=transactions_report_{start_str}_{end_str}.pdf"}
                 )
             elif format_type == "csv":
-                csv_content = export_data_csv(transactions)
                 return Response(
-                    csv_content,
+                    stream_data_csv(transactions),
                     mimetype="text/csv",
                     headers={"Content-Disposition": f"attachment; filename=transactions_report_{start_str}_{end_str}.csv"}
                 )
@@ -1600,9 +2065,9 @@ def export_report():
             users = User.query.all()
             user_stats = []
             
+            borrow_counts = borrow_counts_by(Borrow.user_id)
             for user in users:
-                borrow_count = Borrow.query.filter_by(user_id=user.id).count()
-                active_borrows = Borrow.query.filter_by(user_id=user.id, return_date=None).count()
+                borrow_count, active_borrows = borrow_counts.get(user.id, (0, 0))
                 
                 user_stats.append({
                     "ID": user.id,
@@ -1631,9 +2096,8 @@ def export_report():
                     headers={"Content-Disposition": "attachment; filename=users_report.pdf"}
                 )
             elif format_type == "csv":
-                csv_content = export_data_csv(user_stats)
                 return Response(
-                    csv_content,
+                    stream_data_csv(user_stats),
                     mimetype="text/csv",
                     headers={"Content-Disposition": "attachment; filename=users_report.csv"}
                 )
@@ -1645,9 +2109,9 @@ def export_report():
             items = Item.query.all()
             item_stats = []
             
+            borrow_counts = borrow_counts_by(Borrow.item_id)
             for item in items:
-                borrow_count = Borrow.query.filter_by(item_id=item.id).count()
-                active_borrows = Borrow.query.filter_by(item_id=item.id, return_date=None).count()
+                borrow_count, active_borrows = borrow_counts.get(item.id, (0, 0))
                 
                 item_stats.append({
                     "ID": item.id,
@@ -1675,9 +2139,8 @@ def export_report():
                     headers={"Content-Disposition": "attachment; filename=items_report.pdf"}
                 )
             elif format_type == "csv":
-                csv_content = export_data_csv(item_stats)
                 return Response(
-                    csv_content,
+                    stream_data_csv(item_stats),
                     mimetype="text/csv",
                     headers={"Content-Disposition": "attachment; filename=items_report.csv"}
                 )
@@ -1877,7 +2340,7 @@ def create_admin_user():
             existing_user = User.query.filter_by(rfid_tag=data["rfid_tag"]).first()
             if existing_user:
                 # For admin users, allow RFID override but inform about the conflict
-                current_admin = User.query.get(get_jwt_identity())
+                current_admin = g.current_user
                 if current_admin and current_admin.role == "admin":
                     # Log the RFID override during creation
                     try:
@@ -1958,7 +2421,7 @@ def update_admin_user(user_id):
         if "rfid_tag" in data and data["rfid_tag"] != user.rfid_tag:
             if data["rfid_tag"] and User.query.filter(User.rfid_tag == data["rfid_tag"], User.id != user_id).first():
                 # For admin users, allow RFID override but log it and inform about the conflict
-                current_admin = User.query.get(get_jwt_identity())
+                current_admin = g.current_user
                 if current_admin and current_admin.role == "admin":
                     # Log the RFID override
                     try:
@@ -2064,12 +2527,21 @@ def get_user_profile():
     """Get current user profile"""
     try:
         current_user_id = get_jwt_identity()
+        entry = _profile_cache.get(current_user_id)
+        if entry and entry[0] > time.monotonic():
+            return Response(entry[1], mimetype="application/json")
+
         user = db.session.get(User, current_user_id)
 
         if not user:
             return jsonify({"error": "User not found"}), 404
 
-        return jsonify(user.to_dict())
+        response = jsonify(user.to_dict())
+        _profile_cache[current_user_id] = (
+            time.monotonic() + PROFILE_CACHE_SECONDS,
+            response.get_data(),
+        )
+        return response
     except Exception as e:
         logger.error(f"Get user profile error: {e}")
         return jsonify({"error": "Internal server error"}), 500
@@ -2083,21 +2555,18 @@ def get_recent_activity():
     try:
         limit = request.args.get("limit", 10, type=int)
 
-        # Get recent logs with user information
-        recent_logs = (
-            db.session.query(Log).order_by(Log.timestamp.desc()).limit(limit).all()
-        )
+        # Get recent logs with the username joined in, in a single query
+        recent_logs = db.session.execute(recent_activity_stmt(limit)).all()
 
         activity_data = []
-        for log in recent_logs:
-            user = User.query.get(log.user_id) if log.user_id else None
+        for log, username in recent_logs:
             activity_data.append(
                 {
                     "id": log.id,
                     "action_type": log.action_type,
                     "description": log.notes,  # Use notes instead of details
                     "timestamp": log.timestamp.isoformat(),
-                    "user_name": user.username if user else "Unknown",
+                    "user_name": username or "Unknown",
                     "user_id": log.user_id,
                 }
             )
@@ -2623,13 +3092,43 @@ def rfid_access_reservation(rfid_tag):
         return jsonify({"error": "Internal server error"}), 500
 
 
+@app.route("/api/admin/export/jobs/<job_id>", methods=["GET"])
+@jwt_required()
+@admin_required
+def get_export_job(job_id):
+    """Poll a background export; returns the file once it is ready"""
+    prune_export_jobs()
+    # Job ids come from secrets.token_urlsafe; anything else is not a job file
+    job = read_export_job(job_id) if job_id.replace("-", "").replace("_", "").isalnum() else None
+    if job is None:
+        return jsonify({"error": "Export job not found"}), 404
+    if job["status"] == "pending":
+        return jsonify({"status": "pending"}), 202
+
+    try:
+        if job["status"] != "done":
+            return jsonify({"error": "Internal server error"}), 500
+        with open(export_job_path(job_id, ".out"), "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        # Another request already downloaded it
+        return jsonify({"error": "Export job not found"}), 404
+    finally:
+        remove_export_job(job_id)
+    return Response(
+        content,
+        mimetype=job["mimetype"],
+        headers={"Content-Disposition": f"attachment; filename={job['filename']}"},
+    )
+
+
 @app.route("/api/admin/export/payments", methods=["GET"])
 @jwt_required()
 @admin_required
 def export_payments():
     """Export payments data in various formats"""
     def get_payments_data():
-        return Payment.query.all()
+        return Payment.query.options(selectinload(Payment.user))
     
     def format_payments_data(payments):
         payment_data = []
@@ -2654,7 +3153,7 @@ def export_payments():
 def export_users():
     """Export users data in various formats"""
     def get_users_data():
-        return User.query.all()
+        return User.query
     
     def format_users_data(users):
         users_data = []
@@ -2683,7 +3182,7 @@ def export_users():
 def export_items():
     """Export items data in various formats"""
     def get_items_data():
-        return Item.query.all()
+        return Item.query.options(selectinload(Item.locker))
     
     def format_items_data(items):
         items_data = []
@@ -2709,7 +3208,7 @@ def export_items():
 def export_lockers():
     """Export lockers data in various formats"""
     def get_lockers_data():
-        return Locker.query.all()
+        return Locker.query
     
     def format_lockers_data(lockers):
         lockers_data = []
@@ -2738,7 +3237,7 @@ def export_lockers():
 def export_borrows():
     """Export borrows data in various formats"""
     def get_borrows_data():
-        return Borrow.query.all()
+        return Borrow.query.options(*BORROW_RELATIONS)
     
     def format_borrows_data(borrows):
         borrows_data = []
@@ -2766,10 +3265,15 @@ def export_reservations():
     """Export reservations data in various formats"""
     def get_reservations_data():
         status_filter = request.args.get("status", None)
-        query = Reservation.query
+        query = Reservation.query.options(
+            selectinload(Reservation.user),
+            selectinload(Reservation.locker),
+            selectinload(Reservation.modified_by_user),
+            selectinload(Reservation.cancelled_by_user),
+        )
         if status_filter:
             query = query.filter_by(status=status_filter)
-        return query.all()
+        return query
     
     def format_reservations_data(reservations):
         reservations_data = []
@@ -2797,7 +3301,7 @@ def export_reservations():
 def export_logs_new():
     """Export logs data in various formats using common function"""
     def get_logs_data():
-        return Log.query.order_by(Log.timestamp.desc()).all()
+        return Log.query.options(*LOG_RELATIONS).order_by(Log.timestamp.desc())
     
     def format_logs_data(logs):
         logs_data = []
@@ -2846,6 +3350,14 @@ if __name__ == "__main__":
     parser.add_argument(
         "--rs485-real", action="store_true", help="Enable real RS485 hardware mode (disable mock mode)"
     )
+    parser.add_argument(
+        "--debug", action="store_true", help="Run with the Flask debugger and reloader"
+    )
+    parser.add_argument(
+        "--init-only",
+        action="store_true",
+        help="Initialize the database and exit (run before starting gunicorn)",
+    )
 
     args = parser.parse_args()
 
@@ -2969,6 +3481,9 @@ if __name__ == "__main__":
                 print(f"Database already contains {Locker.query.count()} lockers")
         print("Real data mode initialized!")
 
+    if args.init_only:
+        sys.exit(0)
+
     print(f"Starting Smart Locker System on {args.host}:{args.port}")
     if args.minimal:
         print("Running in minimal mode (admin user, 62 lockers with RS485 mapping)")
@@ -2976,4 +3491,5 @@ if __name__ == "__main__":
         print("Loading comprehensive demo data")
     else:
         print("Running in real data mode (62 lockers with RS485 mapping)")
-    app.run(host=args.host, port=args.port, debug=True)
+    # Leave debug unset without --debug so FLASK_DEBUG still applies
+    app.run(host=args.host, port=args.port, debug=args.debug or None)
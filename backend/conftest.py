@@ -15,6 +15,14 @@ import os
 import tempfile
 from datetime import datetime, timedelta
 
+import requests
+
+from tests._http import token_for
+
+# Cheap password hashing for tests; must be set before models is imported.
+# Production keeps werkzeug's scrypt default.
+os.environ.setdefault("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1")
+
 # Import models for fixtures
 try:
     from models import User, Locker, Item, Log, Borrow, Payment, Reservation
@@ -33,8 +41,45 @@ def app_config():
     return True
 
 
+def _login_token(username, password):
+    """Log in against the running server and return the JWT, or None"""
+    try:
+        return token_for(username, password)
+    except (requests.RequestException, KeyError, ValueError):
+        return None
+
+
+@pytest.fixture(scope="session")
+def admin_token():
+    """Admin JWT shared by every test in the session"""
+    return _login_token("admin", "admin123")
+
+
+@pytest.fixture(scope="session")
+def student_token():
+    """Student JWT shared by every test in the session"""
+    return _login_token("student1", "student123")
+
+
+@pytest.fixture(scope="session")
+def manager_token():
+    """Manager JWT shared by every test in the session"""
+    return _login_token("manager", "manager123")
+
+
+@pytest.fixture(scope="session")
+def template_password_hash():
+    """Hash the shared test password once per session (hashing is slow)"""
+    try:
+        user = User(username="template")
+    except NameError:
+        return None
+    user.set_password("password123")
+    return user.password_hash
+
+
 @pytest.fixture
-def test_user():
+def test_user(template_password_hash):
     """Create test user fixture"""
     try:
         user = User(
@@ -45,7 +90,7 @@ def test_user():
             role="student",
             student_id="2024TEST001"
         )
-        user.set_password("password123")
+        user.password_hash = template_password_hash
         return user
     except NameError:
         # Return a mock user if models are not available
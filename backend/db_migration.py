@@ -87,15 +87,26 @@ def migrate_log_table():
     return True
 
 def create_indexes():
-    """Create indexes for better query performance on logs"""
+    """Create indexes for better query performance on logs and foreign keys"""
     with app.app_context():
         try:
             # Create indexes for common log queries
             indexes = [
                 ("CREATE INDEX IF NOT EXISTS idx_log_timestamp ON log(timestamp)", "timestamp"),
                 ("CREATE INDEX IF NOT EXISTS idx_log_action_type ON log(action_type)", "action_type"),
+                ("CREATE INDEX IF NOT EXISTS idx_log_action_type_timestamp ON log(action_type, timestamp)", "action_type_timestamp"),
                 ("CREATE INDEX IF NOT EXISTS idx_log_user_id ON log(user_id)", "user_id"),
                 ("CREATE INDEX IF NOT EXISTS idx_log_ip_address ON log(ip_address)", "ip_address"),
+                ("CREATE INDEX IF NOT EXISTS idx_log_item_id ON log(item_id)", "item_id"),
+                ("CREATE INDEX IF NOT EXISTS idx_log_locker_id ON log(locker_id)", "locker_id"),
+                # Foreign keys, named as the models' index=True columns
+                ("CREATE INDEX IF NOT EXISTS ix_borrow_user_id ON borrow(user_id)", "borrow_user_id"),
+                ("CREATE INDEX IF NOT EXISTS ix_borrow_item_id ON borrow(item_id)", "borrow_item_id"),
+                ("CREATE INDEX IF NOT EXISTS ix_borrow_locker_id ON borrow(locker_id)", "borrow_locker_id"),
+                ("CREATE INDEX IF NOT EXISTS ix_item_locker_id ON item(locker_id)", "item_locker_id"),
+                ("CREATE INDEX IF NOT EXISTS ix_reservation_user_id ON reservation(user_id)", "reservation_user_id"),
+                ("CREATE INDEX IF NOT EXISTS ix_reservation_locker_id ON reservation(locker_id)", "reservation_locker_id"),
+                ("CREATE INDEX IF NOT EXISTS ix_payment_user_id ON payment(user_id)", "payment_user_id"),
             ]
             
             for index_sql, index_name in indexes:
@@ -0,0 +1,40 @@
+"""
+Gunicorn settings for serving the Smart Locker backend in production
+
+    python app.py --init-only
+    gunicorn -c gunicorn.conf.py app:app
+
+The app is imported once in the master process (preload_app) so the
+SQLAlchemy mapper setup and the Jinja bytecode cache are shared by the
+workers copy-on-write. Database setup is left to ``--init-only`` so the
+workers never race each other creating tables or seed data.
+"""
+
+import multiprocessing
+import os
+
+# BIND takes any gunicorn address, e.g. unix:/run/smartlocker/gunicorn.sock
+# when nginx runs on the same host
+bind = os.environ.get(
+    "BIND", f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5050')}"
+)
+preload_app = True
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+timeout = 120
+keepalive = 5
+
+# Every worker opens its own RS485 connection, so with real hardware a
+# single worker (using threads for concurrency) owns the serial port
+if os.environ.get("RS485_MOCK_MODE", "false").lower() == "true":
+    workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+else:
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master process"""
+    from app import app, db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
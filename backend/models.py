@@ -1,11 +1,77 @@
+import json
+import os
 import random
 import string
 from datetime import datetime, timedelta
+from functools import lru_cache
 
+import numpy as np
+from sqlalchemy import insert, text
 from werkzeug.security import (check_password_hash,  # type: ignore[import]
                                generate_password_hash)
 
 
+# Werkzeug's default; the test suite lowers it via PASSWORD_HASH_METHOD
+PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt")
+
+
+def password_hash_strength(password_hash):
+    """Rank a stored hash's "method:params" for rehashing; higher is stronger
+
+    Only the KDFs approved here are ranked (scrypt above any PBKDF2, then by
+    work factor); anything else returns None and is never rewritten.
+    """
+    method, *params = password_hash.split("$", 1)[0].split(":")
+    try:
+        if method == "scrypt" and len(params) == 3:  # scrypt:N:r:p
+            n, r, p = map(int, params)
+            return (2, n * r * p)
+        if method == "pbkdf2" and len(params) == 2:  # pbkdf2:hash:iterations
+            return (1, int(params[1]))
+    except ValueError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=1)
+def configured_hash_strength():
+    """Strength of the hashes PASSWORD_HASH_METHOD produces"""
+    return password_hash_strength(
+        generate_password_hash("", method=PASSWORD_HASH_METHOD)
+    )
+
+
+def needs_rehash(password_hash):
+    """Whether a hash should move to PASSWORD_HASH_METHOD on next login
+
+    Only upgrades are made, so a weaker configured method (like the test
+    suite's one-iteration PBKDF2) never rewrites stronger stored hashes.
+    """
+    current = password_hash_strength(password_hash)
+    target = configured_hash_strength()
+    return current is not None and target is not None and target > current
+
+SEED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed")
+
+
+def load_seed_data(name):
+    """Load a demo data set from backend/seed/<name>.json"""
+    with open(os.path.join(SEED_DIR, f"{name}.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _draw_log_rows(n_users, n_items, n_lockers, n_actions, n_rows, rng):
+    """Draw random demo log rows as an (n_rows, 5) int64 array
+
+    Columns are user index, item index, locker index, action code and
+    days before now (1-90).
+    """
+    highs = np.array([n_users, n_items, n_lockers, n_actions, 90], dtype=np.int64)
+    draws = rng.integers(0, highs, size=(n_rows, len(highs)), dtype=np.int64)
+    draws[:, 4] += 1
+    return draws
+
+
 def init_models(db):
     class User(db.Model):
         id = db.Column(db.Integer, primary_key=True)
@@ -44,10 +110,18 @@ def init_models(db):
         )
 
         def set_password(self, password):
-            self.password_hash = generate_password_hash(password)
+            self.password_hash = generate_password_hash(
+                password, method=PASSWORD_HASH_METHOD
+            )
 
         def check_password(self, password):
-            return check_password_hash(self.password_hash, password)
+            if not check_password_hash(self.password_hash, password):
+                return False
+            # Upgrade hashes made with weaker KDF settings, so raising
+            # PASSWORD_HASH_METHOD takes effect on next login
+            if needs_rehash(self.password_hash):
+                self.set_password(password)
+            return True
 
         def to_dict(self):
             return {
@@ -114,8 +188,12 @@ def init_models(db):
     class Reservation(db.Model):
         id = db.Column(db.Integer, primary_key=True)
         reservation_code = db.Column(db.String(16), unique=True, nullable=False)
-        user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
-        locker_id = db.Column(db.Integer, db.ForeignKey("locker.id"), nullable=False)
+        user_id = db.Column(
+            db.Integer, db.ForeignKey("user.id"), nullable=False, index=True
+        )
+        locker_id = db.Column(
+            db.Integer, db.ForeignKey("locker.id"), nullable=False, index=True
+        )
         start_time = db.Column(db.DateTime, nullable=False)
         end_time = db.Column(db.DateTime, nullable=False)
         status = db.Column(
@@ -193,7 +271,7 @@ def init_models(db):
         serial_number = db.Column(db.String(100), unique=True)
         purchase_date = db.Column(db.DateTime)
         warranty_expiry = db.Column(db.DateTime)
-        locker_id = db.Column(db.Integer, db.ForeignKey("locker.id"))
+        locker_id = db.Column(db.Integer, db.ForeignKey("locker.id"), index=True)
         is_available = db.Column(db.Boolean, default=True)
         is_active = db.Column(db.Boolean, default=True)
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -217,6 +295,17 @@ def init_models(db):
             }
 
     class Log(db.Model):
+        # Reports, exports and recent activity filter and sort on timestamp,
+        # often within one action type, and join the user/item/locker rows;
+        # same names as db_migration.py
+        __table_args__ = (
+            db.Index("idx_log_timestamp", "timestamp"),
+            db.Index("idx_log_action_type_timestamp", "action_type", "timestamp"),
+            db.Index("idx_log_user_id", "user_id"),
+            db.Index("idx_log_item_id", "item_id"),
+            db.Index("idx_log_locker_id", "locker_id"),
+        )
+
         id = db.Column(db.Integer, primary_key=True)
         user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
         item_id = db.Column(db.Integer, db.ForeignKey("item.id"))
@@ -263,9 +352,9 @@ def init_models(db):
 
     class Borrow(db.Model):
         id = db.Column(db.Integer, primary_key=True)
-        user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
-        item_id = db.Column(db.Integer, db.ForeignKey("item.id"))
-        locker_id = db.Column(db.Integer, db.ForeignKey("locker.id"))
+        user_id = db.Column(db.Integer, db.ForeignKey("user.id"), index=True)
+        item_id = db.Column(db.Integer, db.ForeignKey("item.id"), index=True)
+        locker_id = db.Column(db.Integer, db.ForeignKey("locker.id"), index=True)
         borrowed_at = db.Column(db.DateTime, default=datetime.utcnow)
         due_date = db.Column(db.DateTime)
         returned_at = db.Column(db.DateTime)
@@ -302,7 +391,7 @@ def init_models(db):
 
     class Payment(db.Model):
         id = db.Column(db.Integer, primary_key=True)
-        user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
+        user_id = db.Column(db.Integer, db.ForeignKey("user.id"), index=True)
         amount = db.Column(db.Float, nullable=False)
         method = db.Column(db.String(32), nullable=False)
         status = db.Column(db.String(16), default="completed")
@@ -322,15 +411,18 @@ def init_models(db):
                 "description": self.description,
             }
 
-    def generate_dummy_data(force_regenerate=False):
-        """Generate comprehensive dummy data for testing"""
-        
+    def _populate_dummy_data(force_regenerate):
         # Check if demo data already exists to avoid duplicates
         existing_demo_users = User.query.filter(User.username.like('demo_%')).count()
         if existing_demo_users > 0 and not force_regenerate:
             print("Demo data already exists, skipping generation...")
             return
-        
+
+        # Seed everything in one transaction. Demo data can always be
+        # regenerated, so skip waiting on the WAL flush for this commit only.
+        if db.engine.dialect.name == "postgresql":
+            db.session.execute(text("SET LOCAL synchronous_commit TO OFF"))
+
         # If force_regenerate is True, clear existing demo data first
         if force_regenerate:
             print("Force regenerating demo data...")
@@ -378,13 +470,9 @@ def init_models(db):
                 db.session.query(Item.id)
             )).delete(synchronize_session=False)
             Item.query.delete()
-            
-            db.session.commit()
 
         # Create users - much more comprehensive
         # Use environment variables for passwords, fallback to simple demo defaults
-        import os
-
         admin_password = os.environ.get("ADMIN_PASSWORD", "admin123")
         manager_password = os.environ.get("MANAGER_PASSWORD", "manager123")
         supervisor_password = os.environ.get(
@@ -928,790 +1016,123 @@ def init_models(db):
             )
             db.session.add(locker)
             lockers.append(locker)
-        db.session.commit()
+        # Assign primary keys without ending the transaction
+        db.session.flush()
 
         # Create items - much more comprehensive (100+ items)
-        items_data = [
-            # Electronics (30 items)
-            {
-                "name": 'MacBook Pro 16"',
-                "description": "Apple MacBook Pro with M2 chip",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_MBP001",
-            },
-            {
-                "name": 'MacBook Air 13"',
-                "description": "Apple MacBook Air M1",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_MBA001",
-            },
-            {
-                "name": "Dell XPS 15",
-                "description": "Dell XPS 15 Laptop",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_DXP001",
-            },
-            {
-                "name": 'iPad Pro 12.9"',
-                "description": "Apple iPad Pro with Apple Pencil",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_IPP001",
-            },
-            {
-                "name": "iPad Air",
-                "description": "Apple iPad Air",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_IPA001",
-            },
-            {
-                "name": "Samsung Galaxy Tab",
-                "description": "Samsung Galaxy Tab S8",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_SGT001",
-            },
-            {
-                "name": "iPhone 15 Pro",
-                "description": "Apple iPhone 15 Pro",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_IPH001",
-            },
-            {
-                "name": "Samsung Galaxy S24",
-                "description": "Samsung Galaxy S24 Ultra",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_SGS001",
-            },
-            {
-                "name": "Canon EOS R5",
-                "description": "Canon EOS R5 Camera",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_CER001",
-            },
-            {
-                "name": "Sony A7 IV",
-                "description": "Sony A7 IV Mirrorless Camera",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_SAV001",
-            },
-            {
-                "name": 'MacBook Pro 14"',
-                "description": 'Apple MacBook Pro 14" M3',
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_MBP002",
-            },
-            {
-                "name": "Dell Latitude",
-                "description": "Dell Latitude Business Laptop",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_DLT001",
-            },
-            {
-                "name": "HP EliteBook",
-                "description": "HP EliteBook 840",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_HEB001",
-            },
-            {
-                "name": "Lenovo ThinkPad",
-                "description": "Lenovo ThinkPad X1 Carbon",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_LTC001",
-            },
-            {
-                "name": "iPad Mini",
-                "description": "Apple iPad Mini 6",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_IPM001",
-            },
-            {
-                "name": "Surface Pro",
-                "description": "Microsoft Surface Pro 9",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_MSP001",
-            },
-            {
-                "name": "iPhone 14",
-                "description": "Apple iPhone 14",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_IPH002",
-            },
-            {
-                "name": "Google Pixel 8",
-                "description": "Google Pixel 8 Pro",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_GPP001",
-            },
-            {
-                "name": "Nikon Z6",
-                "description": "Nikon Z6 Mirrorless Camera",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_NZ6001",
-            },
-            {
-                "name": "Fujifilm X-T5",
-                "description": "Fujifilm X-T5 Camera",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_FXT001",
-            },
-            {
-                "name": "GoPro Hero 11",
-                "description": "GoPro Hero 11 Black",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_GPH001",
-            },
-            {
-                "name": "DJI Mini 3",
-                "description": "DJI Mini 3 Pro Drone",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_DJM001",
-            },
-            {
-                "name": "AirPods Pro",
-                "description": "Apple AirPods Pro 2",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_APP001",
-            },
-            {
-                "name": "Sony WH-1000XM5",
-                "description": "Sony WH-1000XM5 Headphones",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_SWH001",
-            },
-            {
-                "name": "Bose QuietComfort",
-                "description": "Bose QuietComfort 45",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_BQC001",
-            },
-            {
-                "name": "Apple Watch",
-                "description": "Apple Watch Series 9",
-                "category": "electronics",
-                "condition": "excellent",
-                "serial_number": "demo_AW9001",
-            },
-            {
-                "name": "Samsung Galaxy Watch",
-                "description": "Samsung Galaxy Watch 6",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_SGW001",
-            },
-            {
-                "name": "Kindle Paperwhite",
-                "description": "Amazon Kindle Paperwhite",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_KPP001",
-            },
-            {
-                "name": "Roku Ultra",
-                "description": "Roku Ultra Streaming Device",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_RKU001",
-            },
-            {
-                "name": "Chromecast",
-                "description": "Google Chromecast 4K",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_GCC001",
-            },
-            {
-                "name": "Fire TV Stick",
-                "description": "Amazon Fire TV Stick 4K",
-                "category": "electronics",
-                "condition": "good",
-                "serial_number": "demo_AFS001",
-            },
-            # Books (25 items)
-            {
-                "name": "Python Programming",
-                "description": "Python Programming for Beginners",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BPY001",
-            },
-            {
-                "name": "Data Science Handbook",
-                "description": "Complete Data Science Guide",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BDS001",
-            },
-            {
-                "name": "Machine Learning",
-                "description": "Introduction to Machine Learning",
-                "category": "books",
-                "condition": "fair",
-                "serial_number": "demo_BML001",
-            },
-            {
-                "name": "Web Development",
-                "description": "Modern Web Development",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BWD001",
-            },
-            {
-                "name": "Database Design",
-                "description": "Database Design Principles",
-                "category": "books",
-                "condition": "excellent",
-                "serial_number": "demo_BDD001",
-            },
-            {
-                "name": "JavaScript Guide",
-                "description": "JavaScript: The Definitive Guide",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BJS001",
-            },
-            {
-                "name": "React Development",
-                "description": "Learning React",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BRD001",
-            },
-            {
-                "name": "Node.js Guide",
-                "description": "Node.js Design Patterns",
-                "category": "books",
-                "condition": "fair",
-                "serial_number": "demo_BND001",
-            },
-            {
-                "name": "Docker Handbook",
-                "description": "Docker in Practice",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BDH001",
-            },
-            {
-                "name": "Kubernetes Guide",
-                "description": "Kubernetes: Up and Running",
-                "category": "books",
-                "condition": "excellent",
-                "serial_number": "demo_BKG001",
-            },
-            {
-                "name": "AWS Solutions",
-                "description": "AWS Solutions Architect",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BAS001",
-            },
-            {
-                "name": "Azure Fundamentals",
-                "description": "Microsoft Azure Fundamentals",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BAF001",
-            },
-            {
-                "name": "Google Cloud",
-                "description": "Google Cloud Platform",
-                "category": "books",
-                "condition": "fair",
-                "serial_number": "demo_BGC001",
-            },
-            {
-                "name": "DevOps Handbook",
-                "description": "The DevOps Handbook",
-                "category": "books",
-                "condition": "excellent",
-                "serial_number": "demo_BDH002",
-            },
-            {
-                "name": "Clean Code",
-                "description": "Clean Code: A Handbook",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BCC001",
-            },
-            {
-                "name": "Design Patterns",
-                "description": "Design Patterns: Elements",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BDP001",
-            },
-            {
-                "name": "Refactoring",
-                "description": "Refactoring: Improving Design",
-                "category": "books",
-                "condition": "fair",
-                "serial_number": "demo_BRF001",
-            },
-            {
-                "name": "Test Driven Development",
-                "description": "Test-Driven Development",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BTD001",
-            },
-            {
-                "name": "Agile Development",
-                "description": "Agile Software Development",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BAD001",
-            },
-            {
-                "name": "Scrum Guide",
-                "description": "The Scrum Guide",
-                "category": "books",
-                "condition": "excellent",
-                "serial_number": "demo_BSG001",
-            },
-            {
-                "name": "Git Version Control",
-                "description": "Pro Git",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BGV001",
-            },
-            {
-                "name": "Linux Administration",
-                "description": "Linux System Administration",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BLA001",
-            },
-            {
-                "name": "Network Security",
-                "description": "Network Security Essentials",
-                "category": "books",
-                "condition": "fair",
-                "serial_number": "demo_BNS001",
-            },
-            {
-                "name": "Cryptography",
-                "description": "Applied Cryptography",
-                "category": "books",
-                "condition": "excellent",
-                "serial_number": "demo_BCR001",
-            },
-            {
-                "name": "Computer Networks",
-                "description": "Computer Networks",
-                "category": "books",
-                "condition": "good",
-                "serial_number": "demo_BCN001",
-            },
-            # Tools (25 items)
-            {
-                "name": "Arduino Kit",
-                "description": "Arduino Starter Kit with Components",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TAR001",
-            },
-            {
-                "name": "Raspberry Pi 4",
-                "description": "Raspberry Pi 4 Model B",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_TRP001",
-            },
-            {
-                "name": "Soldering Iron",
-                "description": "Professional Soldering Iron",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TSI001",
-            },
-            {
-                "name": "Multimeter",
-                "description": "Digital Multimeter",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TMM001",
-            },
-            {
-                "name": "Oscilloscope",
-                "description": "Digital Oscilloscope",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_TOS001",
-            },
-            {
-                "name": "3D Printer",
-                "description": "Creality Ender 3 Pro",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_T3P001",
-            },
-            {
-                "name": "Laser Cutter",
-                "description": "CO2 Laser Cutter",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_TLC001",
-            },
-            {
-                "name": "CNC Machine",
-                "description": "Desktop CNC Router",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TCM001",
-            },
-            {
-                "name": "Drill Press",
-                "description": "Bench Drill Press",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TDP001",
-            },
-            {
-                "name": "Band Saw",
-                "description": "Table Band Saw",
-                "category": "tools",
-                "condition": "fair",
-                "serial_number": "demo_TBS001",
-            },
-            {
-                "name": "Circular Saw",
-                "description": "Portable Circular Saw",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TCS001",
-            },
-            {
-                "name": "Jigsaw",
-                "description": "Electric Jigsaw",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TJS001",
-            },
-            {
-                "name": "Router",
-                "description": "Wood Router",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_TWR001",
-            },
-            {
-                "name": "Sander",
-                "description": "Orbital Sander",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TOS002",
-            },
-            {
-                "name": "Air Compressor",
-                "description": "Portable Air Compressor",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TAC001",
-            },
-            {
-                "name": "Welding Machine",
-                "description": "MIG Welding Machine",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_TWM001",
-            },
-            {
-                "name": "Plasma Cutter",
-                "description": "Plasma Cutting Machine",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TPC001",
-            },
-            {
-                "name": "Heat Gun",
-                "description": "Industrial Heat Gun",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_THG001",
-            },
-            {
-                "name": "Hot Air Station",
-                "description": "SMD Hot Air Station",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_THS001",
-            },
-            {
-                "name": "Logic Analyzer",
-                "description": "USB Logic Analyzer",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TLA001",
-            },
-            {
-                "name": "Function Generator",
-                "description": "Signal Function Generator",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TFG001",
-            },
-            {
-                "name": "Power Supply",
-                "description": "Variable Power Supply",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_TPS001",
-            },
-            {
-                "name": "Microscope",
-                "description": "Digital Microscope",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TDM001",
-            },
-            {
-                "name": "Calipers",
-                "description": "Digital Calipers",
-                "category": "tools",
-                "condition": "good",
-                "serial_number": "demo_TDC001",
-            },
-            {
-                "name": "Micrometer",
-                "description": "Digital Micrometer",
-                "category": "tools",
-                "condition": "excellent",
-                "serial_number": "demo_TDM002",
-            },
-            # Audio/Video (20 items)
-            {
-                "name": "Microphone Set",
-                "description": "Professional USB Microphone",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AMS001",
-            },
-            {
-                "name": "Video Camera",
-                "description": "4K Video Camera",
-                "category": "audio",
-                "condition": "excellent",
-                "serial_number": "demo_AVC001",
-            },
-            {
-                "name": "Audio Interface",
-                "description": "USB Audio Interface",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AAI001",
-            },
-            {
-                "name": "Studio Lights",
-                "description": "LED Studio Lighting Kit",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_ASL001",
-            },
-            {
-                "name": "Green Screen",
-                "description": "Professional Green Screen",
-                "category": "audio",
-                "condition": "fair",
-                "serial_number": "demo_AGS001",
-            },
-            {
-                "name": "Tripod",
-                "description": "Professional Camera Tripod",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_ATP001",
-            },
-            {
-                "name": "Gimbal",
-                "description": "3-Axis Camera Gimbal",
-                "category": "audio",
-                "condition": "excellent",
-                "serial_number": "demo_AGM001",
-            },
-            {
-                "name": "Wireless Mic",
-                "description": "Wireless Lavalier Microphone",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AWM001",
-            },
-            {
-                "name": "Mixer",
-                "description": "Audio Mixer Console",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AMX001",
-            },
-            {
-                "name": "Speakers",
-                "description": "Studio Monitor Speakers",
-                "category": "audio",
-                "condition": "excellent",
-                "serial_number": "demo_ASP001",
-            },
-            {
-                "name": "Headphones",
-                "description": "Studio Headphones",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AHD001",
-            },
-            {
-                "name": "MIDI Controller",
-                "description": "USB MIDI Controller",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AMC001",
-            },
-            {
-                "name": "Synthesizer",
-                "description": "Digital Synthesizer",
-                "category": "audio",
-                "condition": "excellent",
-                "serial_number": "demo_ASY001",
-            },
-            {
-                "name": "Drum Machine",
-                "description": "Electronic Drum Machine",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_ADM001",
-            },
-            {
-                "name": "Guitar Amp",
-                "description": "Electric Guitar Amplifier",
-                "category": "audio",
-                "condition": "fair",
-                "serial_number": "demo_AGA001",
-            },
-            {
-                "name": "Bass Amp",
-                "description": "Bass Guitar Amplifier",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_ABA001",
-            },
-            {
-                "name": "Effects Pedal",
-                "description": "Guitar Effects Pedal",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AEP001",
-            },
-            {
-                "name": "Cables",
-                "description": "Professional Audio Cables",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_ACB001",
-            },
-            {
-                "name": "Stand",
-                "description": "Microphone Stand",
-                "category": "audio",
-                "condition": "good",
-                "serial_number": "demo_AMS002",
-            },
-            {
-                "name": "Pop Filter",
-                "description": "Microphone Pop Filter",
-                "category": "audio",
-                "condition": "fair",
-                "serial_number": "demo_APF001",
-            },
+        # Seed data is column-oriented: {"name": [...], "serial_number": [...], ...}
+        items_columns = load_seed_data("items")
+        num_items = len(items_columns["name"])
+        rng = np.random.default_rng()
+        now = np.datetime64(datetime.now(), "us")
+
+        items_columns["locker_id"] = [
+            lockers[i % len(lockers)].id for i in range(num_items)
         ]
+        items_columns["purchase_date"] = (
+            now - rng.integers(30, 366, size=num_items).astype("timedelta64[D]")
+        ).tolist()
+        items_columns["warranty_expiry"] = (
+            now + rng.integers(100, 1001, size=num_items).astype("timedelta64[D]")
+        ).tolist()
 
-        items = []
-        for i, item_data in enumerate(items_data):
-            item = Item(
-                **item_data,
-                locker_id=lockers[i % len(lockers)].id,
-                purchase_date=datetime.now() - timedelta(days=random.randint(30, 365)),
-                warranty_expiry=datetime.now()
-                + timedelta(days=random.randint(100, 1000)),
-            )
-            items.append(item)
-            db.session.add(item)
+        item_rows = [
+            dict(zip(items_columns.keys(), values))
+            for values in zip(*items_columns.values())
+        ]
+        db.session.bulk_insert_mappings(Item, item_rows, return_defaults=True)
 
         # Create reservations - much more comprehensive
         # Remove static reservations_data and generate reservations only for valid users and lockers
         max_reservations = min(len(users), len(lockers))
-        for i in range(max_reservations):
-            user = users[i]
-            locker = lockers[i]
-            reservation = Reservation(
-                reservation_code=Reservation.generate_reservation_code(),
-                user_id=user.id,
-                locker_id=locker.id,
-                start_time=datetime.now() - timedelta(days=i + 1),
-                end_time=datetime.now() + timedelta(days=i + 1),
-                status="active",
-                access_code=Reservation.generate_access_code(),
-                notes=f"Reservation for {user.username}",
-                created_at=datetime.utcnow(),
-            )
-            db.session.add(reservation)
-        db.session.commit()
+        local_now = datetime.now()
+        utc_now = datetime.utcnow()
+        reservation_rows = [
+            {
+                "reservation_code": Reservation.generate_reservation_code(),
+                "user_id": users[i].id,
+                "locker_id": lockers[i].id,
+                "start_time": local_now - timedelta(days=i + 1),
+                "end_time": local_now + timedelta(days=i + 1),
+                "status": "active",
+                "access_code": Reservation.generate_access_code(),
+                "notes": f"Reservation for {users[i].username}",
+                "created_at": utc_now,
+            }
+            for i in range(max_reservations)
+        ]
+        # One executemany-style INSERT for the whole batch
+        db.session.execute(insert(Reservation), reservation_rows)
 
         # Create logs and borrows - much more comprehensive
-        action_types = ["borrow", "return", "maintenance", "check_in", "check_out"]
-        for i in range(500):  # Create 500 log entries
-            user = random.choice(users)
-            item = random.choice(items)
-            locker = random.choice(lockers)
-            action = random.choice(action_types)
-
-            # Create log entry
-            log = Log(
-                user_id=user.id,
-                item_id=item.id,
-                locker_id=locker.id,
-                action_type=action,
-                timestamp=datetime.now() - timedelta(days=random.randint(1, 90)),
-                notes=f"Log entry {i+1} for {action} action",
-            )
-            db.session.add(log)
+        action_types = np.array(
+            ["borrow", "return", "maintenance", "check_in", "check_out"], dtype=object
+        )
+        num_logs = 500
 
-            # Create borrow entries (for active borrows) - more active borrows
-            if (
-                action == "borrow" and random.random() < 0.4
-            ):  # 40% chance of active borrow
-                borrow = Borrow(
-                    user_id=user.id,
-                    item_id=item.id,
-                    borrowed_at=datetime.now() - timedelta(days=random.randint(1, 14)),
-                    due_date=datetime.now() + timedelta(days=random.randint(1, 21)),
-                    status="borrowed",
-                    notes=f"Active borrow for {item.name}",
-                )
-                db.session.add(borrow)
+        # Work on contiguous primary-key arrays instead of ORM objects
+        user_ids_arr = np.array([u.id for u in users], dtype=np.int64)
+        item_ids_arr = np.array([row["id"] for row in item_rows], dtype=np.int64)
+        locker_ids_arr = np.array([l.id for l in lockers], dtype=np.int64)
+        item_names_arr = np.array(items_columns["name"], dtype=object)
+
+        # Draw all random choices for the batch up front
+        draws = _draw_log_rows(
+            len(user_ids_arr),
+            len(item_ids_arr),
+            len(locker_ids_arr),
+            len(action_types),
+            num_logs,
+            rng,
+        )
+        user_idx, item_idx, locker_idx, action_codes, days_ago = draws.T
+        actions = action_types[action_codes]
+        # 40% chance of active borrow for borrow actions - more active borrows
+        active_borrow = (actions == "borrow") & (rng.random(num_logs) < 0.4)
+        borrow_idx = np.flatnonzero(active_borrow)
+        num_borrows = len(borrow_idx)
+
+        # Compute all timestamps in one datetime64 broadcast
+        log_timestamps = (now - days_ago.astype("timedelta64[D]")).tolist()
+        borrowed_ats = (
+            now - rng.integers(1, 15, size=num_borrows).astype("timedelta64[D]")
+        ).tolist()
+        due_dates = (
+            now + rng.integers(1, 22, size=num_borrows).astype("timedelta64[D]")
+        ).tolist()
+
+        log_rows = [
+            {
+                "user_id": int(user_ids_arr[user_idx[i]]),
+                "item_id": int(item_ids_arr[item_idx[i]]),
+                "locker_id": int(locker_ids_arr[locker_idx[i]]),
+                "action_type": actions[i],
+                "timestamp": log_timestamps[i],
+                "notes": f"Log entry {i+1} for {actions[i]} action",
+            }
+            for i in range(num_logs)
+        ]
+        db.session.bulk_insert_mappings(Log, log_rows)
+
+        # Create borrow entries (for active borrows)
+        borrow_rows = [
+            {
+                "user_id": int(user_ids_arr[user_idx[i]]),
+                "item_id": int(item_ids_arr[item_idx[i]]),
+                "borrowed_at": borrowed_ats[n],
+                "due_date": due_dates[n],
+                "status": "borrowed",
+                "notes": f"Active borrow for {item_names_arr[item_idx[i]]}",
+            }
+            for n, i in enumerate(borrow_idx)
+        ]
+        db.session.bulk_insert_mappings(Borrow, borrow_rows)
 
-                # Mark item as unavailable
-                item.is_available = False
+        # Mark borrowed items as unavailable
+        borrowed_item_ids = np.unique(item_ids_arr[item_idx[borrow_idx]]).tolist()
+        Item.query.filter(Item.id.in_(borrowed_item_ids)).update(
+            {"is_available": False}, synchronize_session=False
+        )
 
         # Create payments
         for user in users:
@@ -1727,9 +1148,22 @@ def init_models(db):
 
         db.session.commit()
         print(
-            f"Created {len(users)} users, {len(lockers)} lockers, {len(items)} items, and 500 log entries with active borrows"
+            f"Created {len(users)} users, {len(lockers)} lockers, {num_items} items, and 500 log entries with active borrows"
         )
 
+    def generate_dummy_data(force_regenerate=False):
+        """Generate comprehensive dummy data for testing"""
+        # Primary keys are obtained with explicit flushes, so autoflush only
+        # adds work, and nothing is read back after the final commit
+        session = db.session()
+        previous_settings = (session.autoflush, session.expire_on_commit)
+        session.autoflush = False
+        session.expire_on_commit = False
+        try:
+            _populate_dummy_data(force_regenerate)
+        finally:
+            session.autoflush, session.expire_on_commit = previous_settings
+
     def init_db(minimal=False):
         # This function should be called within an application context
         # The actual database operations are handled in app.py with proper context
@@ -11,8 +11,22 @@ import requests
 BASE_URL = "http://localhost:5050"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def server_health():
+    """Verify the backend is up once per session instead of per test"""
+    try:
+        response = requests.get(f"{BASE_URL}/api/health", timeout=10)
+        return response.status_code == 200
+    except Exception as e:
+        print(f"Health check failed: {e}")
+        return False
+
+
 @pytest.fixture(scope="module")
-def admin_token():
+def admin_token(server_health):
+    if not server_health:
+        print("Skipping admin login - server not healthy")
+        return None
     try:
         response = requests.post(
             f"{BASE_URL}/api/auth/login",
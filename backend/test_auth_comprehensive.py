@@ -17,313 +17,233 @@ In Memory of:
 Comprehensive test suite for login and register functionality.
 """
 
+import uuid
+
+import pytest
 import requests
-import json
-import time
-import unittest
-from datetime import datetime
 
-class TestAuthenticationSystem(unittest.TestCase):
+BASE_URL = "http://localhost:5050"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def server_health():
+    """Verify the backend is up once per session instead of per test"""
+    try:
+        response = requests.get(f"{BASE_URL}/api/health", timeout=10)
+    except Exception as e:
+        pytest.skip(f"Server not reachable: {e}")
+    if response.status_code != 200:
+        pytest.skip(f"Server unhealthy (Status: {response.status_code})")
+
+
+@pytest.fixture(scope="session")
+def http():
+    """Keep-alive HTTP session shared by all tests in a worker"""
+    with requests.Session() as session:
+        session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+        yield session
+
+
+def make_user_data():
+    """Build registration data with a unique username and student ID"""
+    suffix = uuid.uuid4().hex[:8]
+    return {
+        "username": f"testuser_auth_{suffix}",
+        "password": "TestPass123!",
+        "email": f"testauth_{suffix}@example.com",
+        "first_name": "Test",
+        "last_name": "User",
+        "student_id": f"AUTH{suffix}",
+        "role": "student",
+    }
+
+
+@pytest.fixture
+def fresh_user(http):
+    """Register a uniquely named user and return its credentials and token"""
+    user_data = make_user_data()
+    response = http.post(f"{BASE_URL}/api/auth/register", json=user_data)
+    assert response.status_code == 201, f"Registration failed: {response.text}"
+
+    login_response = http.post(
+        f"{BASE_URL}/api/auth/login",
+        json={"username": user_data["username"], "password": user_data["password"]},
+    )
+    assert login_response.status_code == 200, f"Login failed: {login_response.text}"
+    return {**user_data, "token": login_response.json()["token"]}
+
+
+class TestAuthenticationSystem:
     """Comprehensive authentication system tests"""
-    
-    def setUp(self):
-        """Set up test environment"""
-        self.base_url = "http://localhost:5050"
-        self.test_user = {
-            "username": "testuser_auth",
-            "password": "TestPass123!",
-            "email": "testauth@example.com",
-            "first_name": "Test",
-            "last_name": "User",
-            "student_id": "2024AUTH001",
-            "role": "student"
-        }
-        
-    def test_01_health_check(self):
+
+    def test_health_check(self, http):
         """Test if the server is running"""
-        try:
-            response = requests.get(f"{self.base_url}/api/health")
-            self.assertEqual(response.status_code, 200)
-            print("SUCCESS: Server health check passed")
-        except Exception as e:
-            self.fail(f"Server health check failed: {e}")
-    
-    def test_02_register_new_user(self):
+        response = http.get(f"{BASE_URL}/api/health")
+        assert response.status_code == 200
+        print("SUCCESS: Server health check passed")
+
+    def test_register_new_user(self, http):
         """Test user registration with valid data"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/register",
-                json=self.test_user
-            )
-            
-            if response.status_code == 201:
-                data = response.json()
-                self.assertIn("message", data)
-                self.assertIn("user", data)
-                self.assertEqual(data["user"]["username"], self.test_user["username"])
-                print("SUCCESS: User registration with valid data")
-            else:
-                # User might already exist, which is also acceptable
-                data = response.json()
-                if "Username already exists" in data.get("error", ""):
-                    print("INFO: User already exists (expected for repeated tests)")
-                else:
-                    self.fail(f"Registration failed: {data}")
-                    
-        except Exception as e:
-            self.fail(f"Registration test error: {e}")
-    
-    def test_03_register_duplicate_username(self):
+        user_data = make_user_data()
+        response = http.post(f"{BASE_URL}/api/auth/register", json=user_data)
+
+        assert response.status_code == 201, f"Registration failed: {response.text}"
+        data = response.json()
+        assert "message" in data
+        assert "user" in data
+        assert data["user"]["username"] == user_data["username"]
+        print("SUCCESS: User registration with valid data")
+
+    def test_register_duplicate_username(self, http, fresh_user):
         """Test registration with duplicate username"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/register",
-                json=self.test_user
-            )
-            
-            self.assertEqual(response.status_code, 400)
-            data = response.json()
-            self.assertIn("error", data)
-            self.assertIn("Username already exists", data["error"])
-            print("SUCCESS: Duplicate username registration properly rejected")
-            
-        except Exception as e:
-            self.fail(f"Duplicate username test error: {e}")
-    
-    def test_04_register_duplicate_student_id(self):
+        duplicate_user = make_user_data()
+        duplicate_user["username"] = fresh_user["username"]
+
+        response = http.post(f"{BASE_URL}/api/auth/register", json=duplicate_user)
+
+        assert response.status_code == 400
+        data = response.json()
+        assert "error" in data
+        assert "Username already exists" in data["error"]
+        print("SUCCESS: Duplicate username registration properly rejected")
+
+    def test_register_duplicate_student_id(self, http, fresh_user):
         """Test registration with duplicate student ID"""
-        duplicate_user = self.test_user.copy()
-        duplicate_user["username"] = "different_username"
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/register",
-                json=duplicate_user
-            )
-            
-            self.assertEqual(response.status_code, 400)
-            data = response.json()
-            self.assertIn("error", data)
-            self.assertIn("Student ID already exists", data["error"])
-            print("SUCCESS: Duplicate student ID registration properly rejected")
-            
-        except Exception as e:
-            self.fail(f"Duplicate student ID test error: {e}")
-    
-    def test_05_register_missing_required_fields(self):
+        duplicate_user = make_user_data()
+        duplicate_user["student_id"] = fresh_user["student_id"]
+
+        response = http.post(f"{BASE_URL}/api/auth/register", json=duplicate_user)
+
+        assert response.status_code == 400
+        data = response.json()
+        assert "error" in data
+        assert "Student ID already exists" in data["error"]
+        print("SUCCESS: Duplicate student ID registration properly rejected")
+
+    def test_register_missing_required_fields(self, http):
         """Test registration with missing required fields"""
-        incomplete_user = {"username": "incomplete"}
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/register",
-                json=incomplete_user
-            )
-            
-            self.assertEqual(response.status_code, 400)
-            data = response.json()
-            self.assertIn("error", data)
-            self.assertIn("Username and password required", data["error"])
-            print("SUCCESS: Missing required fields properly rejected")
-            
-        except Exception as e:
-            self.fail(f"Missing fields test error: {e}")
-    
-    def test_06_login_valid_user(self):
+        response = http.post(
+            f"{BASE_URL}/api/auth/register", json={"username": "incomplete"}
+        )
+
+        assert response.status_code == 400
+        data = response.json()
+        assert "error" in data
+        assert "Username and password required" in data["error"]
+        print("SUCCESS: Missing required fields properly rejected")
+
+    def test_login_valid_user(self, http, fresh_user):
         """Test login with valid credentials"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/login",
-                json={
-                    "username": self.test_user["username"],
-                    "password": self.test_user["password"]
-                }
-            )
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            self.assertIn("token", data)
-            self.assertIn("user", data)
-            self.assertEqual(data["user"]["username"], self.test_user["username"])
-            print("SUCCESS: Valid user login")
-            return data["token"]
-            
-        except Exception as e:
-            self.fail(f"Valid login test error: {e}")
-    
-    def test_07_login_invalid_password(self):
+        response = http.post(
+            f"{BASE_URL}/api/auth/login",
+            json={
+                "username": fresh_user["username"],
+                "password": fresh_user["password"],
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "token" in data
+        assert "user" in data
+        assert data["user"]["username"] == fresh_user["username"]
+        print("SUCCESS: Valid user login")
+
+    def test_login_invalid_password(self, http, fresh_user):
         """Test login with wrong password"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/login",
-                json={
-                    "username": self.test_user["username"],
-                    "password": "wrongpassword"
-                }
-            )
-            
-            self.assertEqual(response.status_code, 401)
-            data = response.json()
-            self.assertIn("error", data)
-            self.assertIn("Invalid password", data["error"])
-            print("SUCCESS: Invalid password properly rejected")
-            
-        except Exception as e:
-            self.fail(f"Invalid password test error: {e}")
-    
-    def test_08_login_nonexistent_user(self):
+        response = http.post(
+            f"{BASE_URL}/api/auth/login",
+            json={"username": fresh_user["username"], "password": "wrongpassword"},
+        )
+
+        assert response.status_code == 401
+        data = response.json()
+        assert "error" in data
+        assert "Invalid password" in data["error"]
+        print("SUCCESS: Invalid password properly rejected")
+
+    def test_login_nonexistent_user(self, http):
         """Test login with non-existent user"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/login",
-                json={
-                    "username": "nonexistentuser",
-                    "password": "anypassword"
-                }
-            )
-            
-            self.assertEqual(response.status_code, 401)
-            data = response.json()
-            self.assertIn("error", data)
-            self.assertIn("User not found", data["error"])
-            print("SUCCESS: Non-existent user properly rejected")
-            
-        except Exception as e:
-            self.fail(f"Non-existent user test error: {e}")
-    
-    def test_09_login_missing_fields(self):
+        response = http.post(
+            f"{BASE_URL}/api/auth/login",
+            json={"username": "nonexistentuser", "password": "anypassword"},
+        )
+
+        assert response.status_code == 401
+        data = response.json()
+        assert "error" in data
+        assert "User not found" in data["error"]
+        print("SUCCESS: Non-existent user properly rejected")
+
+    def test_login_missing_fields(self, http):
         """Test login with missing fields"""
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/login",
-                json={"username": "testuser"}
-            )
-            
-            self.assertEqual(response.status_code, 400)
-            data = response.json()
-            self.assertIn("error", data)
-            self.assertIn("Username and password required", data["error"])
-            print("SUCCESS: Missing login fields properly rejected")
-            
-        except Exception as e:
-            self.fail(f"Missing login fields test error: {e}")
-    
-    def test_10_logout_functionality(self):
-        """Test logout functionality"""
-        # First login to get token
-        login_response = requests.post(
-            f"{self.base_url}/api/auth/login",
-            json={
-                "username": self.test_user["username"],
-                "password": self.test_user["password"]
-            }
+        response = http.post(
+            f"{BASE_URL}/api/auth/login", json={"username": "testuser"}
         )
-        
-        if login_response.status_code == 200:
-            token = login_response.json()["token"]
-            
-            try:
-                headers = {"Authorization": f"Bearer {token}"}
-                response = requests.post(
-                    f"{self.base_url}/api/auth/logout",
-                    headers=headers
-                )
-                
-                self.assertEqual(response.status_code, 200)
-                data = response.json()
-                self.assertIn("message", data)
-                self.assertIn("Logged out successfully", data["message"])
-                print("SUCCESS: Logout functionality works")
-                
-            except Exception as e:
-                self.fail(f"Logout test error: {e}")
-        else:
-            self.fail("Could not login to test logout")
-    
-    def test_11_jwt_token_validation(self):
+
+        assert response.status_code == 400
+        data = response.json()
+        assert "error" in data
+        assert "Username and password required" in data["error"]
+        print("SUCCESS: Missing login fields properly rejected")
+
+    def test_logout_functionality(self, http, fresh_user):
+        """Test logout functionality"""
+        headers = {"Authorization": f"Bearer {fresh_user['token']}"}
+        response = http.post(f"{BASE_URL}/api/auth/logout", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "message" in data
+        assert "Logged out successfully" in data["message"]
+        print("SUCCESS: Logout functionality works")
+
+    def test_jwt_token_validation(self, http, fresh_user):
         """Test JWT token validation"""
-        # First login to get token
-        login_response = requests.post(
-            f"{self.base_url}/api/auth/login",
-            json={
-                "username": self.test_user["username"],
-                "password": self.test_user["password"]
-            }
-        )
-        
-        if login_response.status_code == 200:
-            token = login_response.json()["token"]
-            
-            try:
-                # Test valid token
-                headers = {"Authorization": f"Bearer {token}"}
-                response = requests.get(
-                    f"{self.base_url}/api/user/profile",
-                    headers=headers
-                )
-                
-                self.assertEqual(response.status_code, 200)
-                print("SUCCESS: Valid JWT token accepted")
-                
-                # Test invalid token
-                invalid_headers = {"Authorization": "Bearer invalid_token"}
-                response = requests.get(
-                    f"{self.base_url}/api/user/profile",
-                    headers=invalid_headers
-                )
-                
-                self.assertEqual(response.status_code, 401)
-                print("SUCCESS: Invalid JWT token properly rejected")
-                
-            except Exception as e:
-                self.fail(f"JWT validation test error: {e}")
-        else:
-            self.fail("Could not login to test JWT validation")
-    
-    def test_12_logging_verification(self):
+        # Test valid token
+        headers = {"Authorization": f"Bearer {fresh_user['token']}"}
+        response = http.get(f"{BASE_URL}/api/user/profile", headers=headers)
+        assert response.status_code == 200
+        print("SUCCESS: Valid JWT token accepted")
+
+        # Test invalid token
+        invalid_headers = {"Authorization": "Bearer invalid_token"}
+        response = http.get(f"{BASE_URL}/api/user/profile", headers=invalid_headers)
+        assert response.status_code == 401
+        print("SUCCESS: Invalid JWT token properly rejected")
+
+    def test_logging_verification(self, http, fresh_user):
         """Test that authentication events are properly logged"""
-        try:
-            # Login as admin to check logs
-            admin_response = requests.post(
-                f"{self.base_url}/api/auth/login",
-                json={"username": "admin", "password": "admin123"}
-            )
-            
-            if admin_response.status_code == 200:
-                admin_token = admin_response.json()["token"]
-                headers = {"Authorization": f"Bearer {admin_token}"}
-                
-                # Get logs
-                logs_response = requests.get(
-                    f"{self.base_url}/api/logs",
-                    headers=headers
-                )
-                
-                if logs_response.status_code == 200:
-                    logs = logs_response.json().get("logs", [])
-                    
-                    # Check for authentication-related logs
-                    auth_actions = ["login", "login_failed", "logout", "register", "register_failed"]
-                    auth_logs = [log for log in logs if log.get("action_type") in auth_actions]
-                    
-                    self.assertGreater(len(auth_logs), 0, "No authentication logs found")
-                    print(f"SUCCESS: Found {len(auth_logs)} authentication log entries")
-                    
-                    # Check for IP address and user agent in logs
-                    logs_with_ip = [log for log in auth_logs if log.get("ip_address")]
-                    logs_with_ua = [log for log in auth_logs if log.get("user_agent")]
-                    
-                    self.assertGreater(len(logs_with_ip), 0, "No logs with IP addresses found")
-                    self.assertGreater(len(logs_with_ua), 0, "No logs with user agents found")
-                    print("SUCCESS: Logs contain IP addresses and user agents")
-                    
-                else:
-                    self.fail("Could not retrieve logs")
-            else:
-                self.fail("Could not login as admin to check logs")
-                
-        except Exception as e:
-            self.fail(f"Logging verification test error: {e}")
+        # Login as admin to check logs
+        admin_response = http.post(
+            f"{BASE_URL}/api/auth/login",
+            json={"username": "admin", "password": "admin123"},
+        )
+        assert admin_response.status_code == 200, "Could not login as admin to check logs"
+
+        admin_token = admin_response.json()["token"]
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        # Get logs
+        logs_response = http.get(f"{BASE_URL}/api/logs", headers=headers, stream=False)
+        assert logs_response.status_code == 200, "Could not retrieve logs"
+        logs = logs_response.json().get("logs", [])
+
+        # Check for authentication-related logs
+        auth_actions = ["login", "login_failed", "logout", "register", "register_failed"]
+        auth_logs = [log for log in logs if log.get("action_type") in auth_actions]
+
+        assert len(auth_logs) > 0, "No authentication logs found"
+        print(f"SUCCESS: Found {len(auth_logs)} authentication log entries")
+
+        # Check for IP address and user agent in logs
+        logs_with_ip = [log for log in auth_logs if log.get("ip_address")]
+        logs_with_ua = [log for log in auth_logs if log.get("user_agent")]
+
+        assert len(logs_with_ip) > 0, "No logs with IP addresses found"
+        assert len(logs_with_ua) > 0, "No logs with user agents found"
+        print("SUCCESS: Logs contain IP addresses and user agents")
+
 
 def run_comprehensive_auth_tests():
     """Run all comprehensive authentication tests"""
@@ -331,36 +251,17 @@ def run_comprehensive_auth_tests():
     print("=======================================================")
     print("Author: Alp Alpdogan")
     print()
-    
-    # Create test suite
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestAuthenticationSystem)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    print()
-    print("Test Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-    if result.failures:
-        print("\nFailures:")
-        for test, traceback in result.failures:
-            print(f"- {test}: {traceback}")
-    
-    if result.errors:
-        print("\nErrors:")
-        for test, traceback in result.errors:
-            print(f"- {test}: {traceback}")
-    
-    if result.wasSuccessful():
+
+    # Tests are independent, so they can be spread across workers with -n
+    exit_code = pytest.main(["-v", __file__])
+
+    if exit_code == 0:
         print("\nSUCCESS: All authentication tests passed!")
     else:
         print("\nERROR: Some authentication tests failed!")
-    
-    return result.wasSuccessful()
+
+    return exit_code == 0
+
 
 if __name__ == "__main__":
-    run_comprehensive_auth_tests() 
\ No newline at end of file
+    run_comprehensive_auth_tests()
@@ -17,14 +17,16 @@ In Memory of:
 Test script to verify enhanced logging functionality.
 """
 
-import requests
-import json
-import time
-from datetime import datetime
+from operator import itemgetter
+
+from tests._http import BASE_URL, client
+
+# Log.to_dict() always includes these keys
+LOG_FIELDS = itemgetter("timestamp", "action_type", "notes", "ip_address")
 
 def test_logging_system():
     """Test the enhanced logging system"""
-    base_url = "http://localhost:5050"
+    base_url = BASE_URL
     
     print("Smart Locker System - Logging Test")
     print("===================================")
@@ -34,7 +36,7 @@ def test_logging_system():
     # Test 1: Failed login attempt (should log login_failed)
     print("1. Testing failed login logging...")
     try:
-        response = requests.post(f"{base_url}/api/auth/login", 
+        response = client().post(f"{base_url}/api/auth/login", 
                                json={"username": "nonexistent", "password": "wrong"})
         print(f"   SUCCESS: Failed login logged (Status: {response.status_code})")
     except Exception as e:
@@ -43,7 +45,7 @@ def test_logging_system():
     # Test 2: Successful login (should log login)
     print("2. Testing successful login logging...")
     try:
-        response = requests.post(f"{base_url}/api/auth/login", 
+        response = client().post(f"{base_url}/api/auth/login", 
                                json={"username": "admin", "password": "admin123"})
         if response.status_code == 200:
             token = response.json().get("token")
@@ -55,47 +57,44 @@ def test_logging_system():
         print(f"   ERROR: Login test error: {e}")
         return
     
+    headers = {"Authorization": f"Bearer {token}"}
+
     # Test 3: Logout (should log logout)
     print("3. Testing logout logging...")
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.post(f"{base_url}/api/auth/logout", headers=headers)
+        response = client().post(f"{base_url}/api/auth/logout", headers=headers)
         print(f"   SUCCESS: Logout logged (Status: {response.status_code})")
     except Exception as e:
         print(f"   ERROR: Logout test error: {e}")
     
-    # Test 4: Check logs endpoint
+    # Test 4: Check logs endpoint. Logout is stateless, so the token from
+    # test 2 still works and the logout above is among the entries
     print("4. Testing logs retrieval...")
     try:
-        # Login again to get token
-        login_response = requests.post(f"{base_url}/api/auth/login", 
-                                     json={"username": "admin", "password": "admin123"})
-        if login_response.status_code == 200:
-            admin_token = login_response.json().get("token")
-            headers = {"Authorization": f"Bearer {admin_token}"}
+        # Let the server filter to our test actions instead of fetching every log
+        test_actions = ["login", "login_failed", "logout"]
+        response = client().get(
+            f"{base_url}/api/logs",
+            params={"action_type": ",".join(test_actions), "per_page": 10},
+            headers=headers,
+        )
+        if response.status_code == 200:
+            logs = response.json().get("logs", [])
+            print(f"   SUCCESS: Retrieved {len(logs)} log entries")
+            
+            # Check for our test entries
+            found_actions = [log["action_type"] for log in logs]
+            print(f"   INFO: Found actions: {found_actions}")
             
-            response = requests.get(f"{base_url}/api/logs", headers=headers)
-            if response.status_code == 200:
-                logs = response.json().get("logs", [])
-                print(f"   SUCCESS: Retrieved {len(logs)} log entries")
-                
-                # Check for our test entries
-                test_actions = ["login", "login_failed", "logout"]
-                found_actions = [log["action_type"] for log in logs if log["action_type"] in test_actions]
-                print(f"   INFO: Found actions: {found_actions}")
-                
-                # Show recent logs
-                print("   INFO: Recent log entries:")
-                for log in logs[:5]:  # Show last 5 logs
-                    timestamp = log.get("timestamp", "N/A")
-                    action = log.get("action_type", "N/A")
-                    notes = log.get("notes", "N/A")
-                    ip = log.get("ip_address", "N/A")
-                    print(f"      {timestamp} | {action} | {notes} | IP: {ip}")
-            else:
-                print(f"   ERROR: Failed to retrieve logs (Status: {response.status_code})")
+            # Show recent logs
+            print("   INFO: Recent log entries:")
+            for log in logs[:5]:  # Show last 5 logs
+                timestamp, action, notes, ip = (
+                    value or "N/A" for value in LOG_FIELDS(log)
+                )
+                print(f"      {timestamp} | {action} | {notes} | IP: {ip}")
         else:
-            print(f"   ERROR: Admin login failed (Status: {login_response.status_code})")
+            print(f"   ERROR: Failed to retrieve logs (Status: {response.status_code})")
     except Exception as e:
         print(f"   ERROR: Logs test error: {e}")
     
@@ -4,10 +4,11 @@ Comprehensive System Integration Test
 Tests all the fixes: database password, demo data serial numbers, RS485 protocol
 """
 
-import requests
 import json
 import time
-from utils.rs485 import generate_rs485_frame, RS485Controller
+from concurrent.futures import ThreadPoolExecutor
+from tests._http import API_BASE, client
+from utils.rs485 import generate_rs485_frames_bulk, RS485Controller
 
 def test_rs485_protocol():
     """Test RS485 protocol implementation"""
@@ -22,8 +23,10 @@ def test_rs485_protocol():
         (15, 12, "5A5A000F000400010C06"),
     ]
     
-    for address, locker, expected in test_cases:
-        result = generate_rs485_frame(address, locker)
+    results = generate_rs485_frames_bulk(
+        [(address, locker) for address, locker, _ in test_cases]
+    )
+    for (address, locker, expected), result in zip(test_cases, results):
         status = "PASS" if result == expected else "FAIL"
         print(f"Address {address}, Locker {locker}: {result} {status}")
         if result != expected:
@@ -43,7 +46,7 @@ def test_database_connection():
     print("=" * 50)
     
     try:
-        response = requests.get("http://localhost:5050/api/health", timeout=5)
+        response = client().get(f"{API_BASE}/health", timeout=5)
         if response.status_code == 200:
             data = response.json()
             print(f"Database Status: {data['database']}")
@@ -63,14 +66,14 @@ def test_demo_data():
     try:
         # Test login to get token
         login_data = {"username": "admin", "password": "admin123"}
-        response = requests.post("http://localhost:5050/api/auth/login", json=login_data)
+        response = client().post(f"{API_BASE}/auth/login", json=login_data)
         
         if response.status_code == 200:
             token = response.json().get("token")
             headers = {"Authorization": f"Bearer {token}"}
             
             # Get items
-            response = requests.get("http://localhost:5050/api/items", headers=headers)
+            response = client().get(f"{API_BASE}/items", headers=headers)
             if response.status_code == 200:
                 items = response.json()
                 print(f"Found {len(items)} items")
@@ -104,6 +107,23 @@ def test_demo_data():
     
     print()
 
+# (connect, read) timeouts - a service that is down fails on connect quickly,
+# while a slow but running one still gets the full read budget
+PROBE_TIMEOUT = (2, 5)
+
+def probe_service(service_name, url):
+    """Return a printable status for one service probe"""
+    try:
+        response = client().get(url, timeout=PROBE_TIMEOUT)
+        if service_name == "Frontend":
+            return "RUNNING" if response.status_code == 200 else "NOT RUNNING"
+        if response.status_code == 200:
+            data = response.json()
+            return f"RUNNING ({data['status']})"
+        return "NOT RUNNING"
+    except Exception as e:
+        return f"ERROR: {e}"
+
 def test_startup_script():
     """Test that startup script works without password prompts"""
     print("Testing Startup Script...")
@@ -111,26 +131,20 @@ def test_startup_script():
     
     # Check if services are running
     services = [
-        ("Backend", "http://localhost:5050/api/health"),
+        ("Backend", f"{API_BASE}/health"),
         ("Frontend", "http://localhost:5173"),
     ]
     
-    for service_name, url in services:
-        try:
-            if service_name == "Frontend":
-                response = requests.get(url, timeout=5)
-                status = "RUNNING" if response.status_code == 200 else "NOT RUNNING"
-            else:
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    status = f"RUNNING ({data['status']})"
-                else:
-                    status = "NOT RUNNING"
-        except Exception as e:
-            status = f"ERROR: {e}"
-        
-        print(f"{service_name}: {status}")
+    # Probes are independent - run them concurrently so a stalled service
+    # costs one timeout instead of adding up. Each pool thread gets its own
+    # session from client()
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        futures = [
+            (service_name, executor.submit(probe_service, service_name, url))
+            for service_name, url in services
+        ]
+        for service_name, future in futures:
+            print(f"{service_name}: {future.result()}")
     
     print()
 
@@ -0,0 +1,64 @@
+"""
+Shared HTTP client for the live-server test scripts
+
+One keep-alive session per thread and one cached login per user, reused
+by tests/test_api.py, test_logging.py and test_system_integration.py.
+"""
+
+import functools
+import socket
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+# The backend binds 0.0.0.0 (IPv4 only); skip resolving "localhost", which
+# may try ::1 first
+BASE_URL = "http://127.0.0.1:5050"
+API_BASE = f"{BASE_URL}/api"
+
+_NODELAY = (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class FastAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets always have Nagle's algorithm disabled"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        options = list(HTTPConnection.default_socket_options)
+        if _NODELAY not in options:
+            options.append(_NODELAY)
+        kwargs["socket_options"] = options
+        super().init_poolmanager(*args, **kwargs)
+
+
+_local = threading.local()
+
+
+def client():
+    """Return this thread's keep-alive session
+
+    requests does not make a Session safe to share between threads, so
+    tests that fan requests out over a thread pool get one per thread.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+        # Backend and frontend each get a pooled keep-alive connection
+        session.mount(
+            "http://",
+            FastAdapter(pool_connections=2, pool_maxsize=20, max_retries=Retry(total=0)),
+        )
+    return session
+
+
+@functools.lru_cache(maxsize=8)
+def token_for(username, password):
+    """Log in once per user and return the cached JWT"""
+    response = client().post(
+        f"{API_BASE}/auth/login",
+        json={"username": username, "password": password},
+        timeout=10,
+    )
+    return response.json()["token"]
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+"""
+Smart Locker System - pytest Configuration for tests/
+Author: Alp Alpdogan
+In memory of Mehmet Ugurlu and Yusuf Alpdogan
+
+LICENSING CONDITION: These memorial dedications and author credits
+must never be removed from this file or any derivative works.
+This condition is binding and must be preserved in all versions.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Flask app, imported once per test process"""
+    from app import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def init_models_fn():
+    """Model factory, imported once per test process"""
+    from models import init_models
+
+    return init_models
@@ -1,27 +1,66 @@
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+import orjson
 import pytest
-import requests
 
-# Test configuration
-BASE_URL = "http://localhost:5050"
-API_BASE = f"{BASE_URL}/api"
+from tests._http import API_BASE, client
+
+# Constant request bodies, encoded once instead of on every call
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_LOGIN_BODIES = {
+    (user, password): orjson.dumps({"username": user, "password": password})
+    for user, password in [
+        ("admin", "admin123"),
+        ("admin", "wrong"),
+        ("student1", "student123"),
+        ("manager", "manager123"),
+    ]
+}
+_MISSING_PASSWORD_BODY = orjson.dumps({"username": "admin"})
+
+
+def _login_body(username, password):
+    """Return the encoded login body, pre-encoded for the known users"""
+    body = _LOGIN_BODIES.get((username, password))
+    if body is None:
+        body = orjson.dumps({"username": username, "password": password})
+    return body
 
 
 class TestAPI:
-    """Comprehensive API test suite for Smart Locker System"""
+    """Comprehensive API test suite for Smart Locker System
+
+    Tests are independent and can run in parallel with ``pytest -n auto``;
+    tests that change server state share the "mutating" xdist group so they
+    stay on one worker.
+    """
+
+    @property
+    def session(self):
+        """Keep-alive client of the calling thread (see tests._http.client)"""
+        return client()
 
     def setup_method(self):
         """Setup for each test method"""
-        self.session = requests.Session()
         self.auth_token = None
+        self.logged_in = False
+
+    @pytest.fixture(autouse=True)
+    def _inject_tokens(self, admin_token, student_token, manager_token):
+        """Reuse the session-wide logins instead of logging in per test"""
+        self.tokens = {
+            "admin": admin_token,
+            "student1": student_token,
+            "manager": manager_token,
+        }
 
     def teardown_method(self):
         """Cleanup after each test method"""
-        if self.auth_token:
-            # Logout if we were logged in
+        if self.logged_in and self.auth_token:
+            # Logout if this test logged in itself
             try:
                 self.session.post(
                     f"{API_BASE}/auth/logout",
@@ -33,14 +72,22 @@ class TestAPI:
     def login(self, username="admin", password="admin123"):
         """Login and store token"""
         response = self.session.post(
-            f"{API_BASE}/auth/login", json={"username": username, "password": password}
+            f"{API_BASE}/auth/login",
+            data=_login_body(username, password),
+            headers=_JSON_HEADERS,
         )
         if response.status_code == 200:
             data = response.json()
             self.auth_token = data.get("token")
+            self.logged_in = True
             return True
         return False
 
+    def use_token(self, username="admin"):
+        """Use the shared session token for a user"""
+        self.auth_token = self.tokens.get(username)
+        return self.auth_token is not None
+
     def get_auth_headers(self):
         """Get headers with authentication token"""
         if self.auth_token:
@@ -58,7 +105,9 @@ class TestAPI:
     def test_login_success(self):
         """Test successful login"""
         response = self.session.post(
-            f"{API_BASE}/auth/login", json={"username": "admin", "password": "admin123"}
+            f"{API_BASE}/auth/login",
+            data=_LOGIN_BODIES["admin", "admin123"],
+            headers=_JSON_HEADERS,
         )
         assert response.status_code == 200
         data = response.json()
@@ -69,17 +118,12 @@ class TestAPI:
     def test_login_invalid_credentials(self):
         """Test login with invalid credentials"""
         response = self.session.post(
-            f"{API_BASE}/auth/login", json={"username": "admin", "password": "wrong"}
+            f"{API_BASE}/auth/login",
+            data=_LOGIN_BODIES["admin", "wrong"],
+            headers=_JSON_HEADERS,
         )
         assert response.status_code == 401
 
-    def test_login_missing_fields(self):
-        """Test login with missing fields"""
-        response = self.session.post(
-            f"{API_BASE}/auth/login", json={"username": "admin"}
-        )
-        assert response.status_code == 400
-
     def test_logout_success(self):
         """Test successful logout"""
         # First login
@@ -96,7 +140,7 @@ class TestAPI:
 
     def test_admin_stats(self):
         """Test admin stats endpoint"""
-        assert self.login()
+        assert self.use_token("admin")
         response = self.session.get(
             f"{API_BASE}/admin/stats", headers=self.get_auth_headers()
         )
@@ -108,7 +152,7 @@ class TestAPI:
 
     def test_admin_users(self):
         """Test admin users endpoint"""
-        assert self.login()
+        assert self.use_token("admin")
         response = self.session.get(
             f"{API_BASE}/admin/users", headers=self.get_auth_headers()
         )
@@ -123,7 +167,7 @@ class TestAPI:
 
     def test_admin_active_borrows(self):
         """Test admin active borrows endpoint"""
-        assert self.login()
+        assert self.use_token("admin")
         response = self.session.get(
             f"{API_BASE}/admin/active-borrows", headers=self.get_auth_headers()
         )
@@ -154,7 +198,7 @@ class TestAPI:
 
     def test_get_lockers_with_auth(self):
         """Test getting lockers with authentication"""
-        assert self.login()
+        assert self.use_token("admin")
         response = self.session.get(
             f"{API_BASE}/lockers", headers=self.get_auth_headers()
         )
@@ -172,7 +216,7 @@ class TestAPI:
 
     def test_get_items_with_auth(self):
         """Test getting items with authentication"""
-        assert self.login()
+        assert self.use_token("admin")
         response = self.session.get(
             f"{API_BASE}/items", headers=self.get_auth_headers()
         )
@@ -183,9 +227,10 @@ class TestAPI:
         assert "id" in data[0]
         assert "name" in data[0]
 
+    @pytest.mark.xdist_group("mutating")
     def test_borrow_item_success(self):
         """Test successful item borrowing"""
-        assert self.login("student1", "student123")
+        assert self.use_token("student1")
 
         # Get available items first
         items_response = self.session.get(
@@ -196,11 +241,9 @@ class TestAPI:
 
         if len(items) > 0:
             # Find an available item
-            available_item = None
-            for item in items:
-                if item.get("status") == "available":
-                    available_item = item
-                    break
+            available_item = next(
+                (item for item in items if item.get("status") == "available"), None
+            )
 
             if available_item:
                 borrow_data = {
@@ -230,9 +273,10 @@ class TestAPI:
         response = self.session.post(f"{API_BASE}/lockers/borrow", json=borrow_data)
         assert response.status_code == 401
 
+    @pytest.mark.xdist_group("mutating")
     def test_return_item_success(self):
         """Test successful item return"""
-        assert self.login("student1", "student123")
+        assert self.use_token("student1")
 
         # First borrow an item
         items_response = self.session.get(
@@ -242,11 +286,9 @@ class TestAPI:
         items = items_response.json()
 
         if len(items) > 0:
-            available_item = None
-            for item in items:
-                if item.get("status") == "available":
-                    available_item = item
-                    break
+            available_item = next(
+                (item for item in items if item.get("status") == "available"), None
+            )
 
             if available_item:
                 # Borrow the item
@@ -275,25 +317,6 @@ class TestAPI:
                 )
                 assert response.status_code == 200
 
-    def test_invalid_endpoint(self):
-        """Test invalid endpoint returns 404"""
-        response = self.session.get(f"{API_BASE}/invalid-endpoint")
-        assert response.status_code == 404
-
-    def test_invalid_method(self):
-        """Test invalid HTTP method returns 405"""
-        response = self.session.post(f"{API_BASE}/lockers")
-        assert response.status_code == 405
-
-    def test_malformed_json(self):
-        """Test malformed JSON returns 400"""
-        response = self.session.post(
-            f"{API_BASE}/auth/login",
-            data="invalid json",
-            headers={"Content-Type": "application/json"},
-        )
-        assert response.status_code == 400
-
     def test_health_check_performance(self):
         """Test health check performance"""
         import time
@@ -316,23 +339,22 @@ class TestAPI:
 
     def test_xss_protection(self):
         """Test XSS protection in responses"""
-        assert self.login()
+        assert self.use_token("admin")
         response = self.session.get(
             f"{API_BASE}/admin/users", headers=self.get_auth_headers()
         )
         assert response.status_code == 200
-        data = response.json()
 
         # Check that no script tags are returned
-        response_text = response.text
-        assert "<script>" not in response_text.lower()
-        assert "javascript:" not in response_text.lower()
+        body = response.content.lower()
+        assert b"<script>" not in body
+        assert b"javascript:" not in body
 
     # New comprehensive tests
 
     def test_locker_operations(self):
         """Test locker open/close operations"""
-        assert self.login()
+        assert self.use_token("admin")
 
         # Get lockers
         lockers_response = self.session.get(
@@ -367,7 +389,7 @@ class TestAPI:
 
     def test_item_management(self):
         """Test item management operations"""
-        assert self.login()
+        assert self.use_token("admin")
 
         # Get items
         items_response = self.session.get(
@@ -385,7 +407,7 @@ class TestAPI:
 
     def test_user_profile(self):
         """Test user profile endpoint"""
-        assert self.login("student1", "student123")
+        assert self.use_token("student1")
 
         response = self.session.get(
             f"{API_BASE}/user/profile", headers=self.get_auth_headers()
@@ -398,7 +420,7 @@ class TestAPI:
 
     def test_borrow_history(self):
         """Test borrow history and management"""
-        assert self.login("student1", "student123")
+        assert self.use_token("student1")
 
         # Get borrows
         response = self.session.get(
@@ -411,29 +433,30 @@ class TestAPI:
 
     def test_admin_export_endpoints(self):
         """Test admin export endpoints"""
-        assert self.login()
-
-        # Test export logs
-        response = self.session.get(
-            f"{API_BASE}/admin/export/logs", headers=self.get_auth_headers()
-        )
-        assert response.status_code == 200
-
-        # Test export users
-        response = self.session.get(
-            f"{API_BASE}/admin/export/users", headers=self.get_auth_headers()
-        )
-        assert response.status_code == 200
+        assert self.use_token("admin")
+        headers = {**self.get_auth_headers(), "Accept-Encoding": "gzip, deflate"}
+
+        # Export logs, users and borrows concurrently
+        exports = ["logs", "users", "borrows"]
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            responses = list(
+                executor.map(
+                    lambda export: self.session.get(
+                        f"{API_BASE}/admin/export/{export}", headers=headers
+                    ),
+                    exports,
+                )
+            )
 
-        # Test export borrows
-        response = self.session.get(
-            f"{API_BASE}/admin/export/borrows", headers=self.get_auth_headers()
-        )
-        assert response.status_code == 200
+        for export, response in zip(exports, responses):
+            assert response.status_code == 200, f"Export {export} failed"
+            # CSV exports are streamed, so they must not be buffered for compression
+            assert response.headers.get("Content-Encoding") is None
+            assert response.headers["Content-Type"].startswith("text/csv")
 
     def test_rs485_test_endpoint(self):
         """Test RS485 test endpoint"""
-        assert self.login()
+        assert self.use_token("admin")
 
         response = self.session.get(
             f"{API_BASE}/admin/rs485/test", headers=self.get_auth_headers()
@@ -444,14 +467,28 @@ class TestAPI:
 
     def test_multiple_user_login(self):
         """Test login with different user types"""
-        # Test admin login
-        assert self.login("admin", "admin123")
-
-        # Test student login
-        assert self.login("student1", "student123")
+        credentials = [
+            ("admin", "admin123"),
+            ("student1", "student123"),
+            ("manager", "manager123"),
+        ]
+
+        # Log in all user types concurrently, one session per thread
+        with ThreadPoolExecutor(max_workers=len(credentials)) as executor:
+            responses = list(
+                executor.map(
+                    lambda creds: self.session.post(
+                        f"{API_BASE}/auth/login",
+                        data=_login_body(*creds),
+                        headers=_JSON_HEADERS,
+                    ),
+                    credentials,
+                )
+            )
 
-        # Test manager login
-        assert self.login("manager", "manager123")
+        for (username, _), response in zip(credentials, responses):
+            assert response.status_code == 200, f"Login failed for {username}"
+            assert response.json()["user"]["username"] == username
 
     def test_invalid_token_access(self):
         """Test access with invalid token"""
@@ -463,9 +500,10 @@ class TestAPI:
         response = self.session.get(f"{API_BASE}/items", headers=headers)
         assert response.status_code == 401
 
+    @pytest.mark.xdist_group("mutating")
     def test_borrow_unavailable_item(self):
         """Test borrowing an unavailable item"""
-        assert self.login("student1", "student123")
+        assert self.use_token("student1")
 
         # First borrow an item to make it unavailable
         items_response = self.session.get(
@@ -475,11 +513,9 @@ class TestAPI:
         items = items_response.json()
 
         if len(items) > 0:
-            available_item = None
-            for item in items:
-                if item.get("status") == "available":
-                    available_item = item
-                    break
+            available_item = next(
+                (item for item in items if item.get("status") == "available"), None
+            )
 
             if available_item:
                 # Borrow the item
@@ -506,7 +542,7 @@ class TestAPI:
 
     def test_return_nonexistent_borrow(self):
         """Test returning a nonexistent borrow"""
-        assert self.login("student1", "student123")
+        assert self.use_token("student1")
 
         return_data = {"condition": "good", "notes": "Test return"}
 
@@ -530,6 +566,7 @@ class TestAPI:
         response = self.session.get(f"{API_BASE}/admin/export/users")
         assert response.status_code == 401
 
+    @pytest.mark.xdist_group("mutating")
     def test_user_registration(self):
         """Test user registration endpoint"""
         registration_data = {
@@ -550,6 +587,7 @@ class TestAPI:
         assert "user" in data
         assert data["user"]["username"] == "testuser"
 
+    @pytest.mark.xdist_group("mutating")
     def test_duplicate_user_registration(self):
         """Test registering duplicate username"""
         # First registration
@@ -572,3 +610,44 @@ class TestAPI:
             f"{API_BASE}/auth/register", json=registration_data
         )
         assert response.status_code == 400
+
+
+class TestAPIContract:
+    """Request validation checks that never reach the database
+
+    These run in-process through Flask's test client, so they need no live
+    server and no network round trip.
+    """
+
+    @pytest.fixture(scope="class")
+    def client(self, app_instance):
+        """Flask test client for the backend app"""
+        return app_instance.test_client()
+
+    def test_login_missing_fields(self, client):
+        """Test login with missing fields"""
+        response = client.post(
+            "/api/auth/login",
+            data=_MISSING_PASSWORD_BODY,
+            headers=_JSON_HEADERS,
+        )
+        assert response.status_code == 400
+
+    def test_invalid_endpoint(self, client):
+        """Test invalid endpoint returns 404"""
+        response = client.get("/api/invalid-endpoint")
+        assert response.status_code == 404
+
+    def test_invalid_method(self, client):
+        """Test invalid HTTP method returns 405"""
+        response = client.post("/api/lockers")
+        assert response.status_code == 405
+
+    def test_malformed_json(self, client):
+        """Test malformed JSON returns 400"""
+        response = client.post(
+            "/api/auth/login",
+            data="invalid json",
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 400
@@ -12,36 +12,127 @@ This condition is binding and must be preserved in all versions.
 
 import pytest
 from datetime import datetime, timedelta
-from models import User, Locker, Item, Log, Borrow, Payment, Reservation
+from operator import attrgetter
+from types import SimpleNamespace
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from models import init_models
+
+# Fixed timestamps keep the date-based tests deterministic
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+_LATER = _NOW + timedelta(hours=1)
+
+# Minimal valid field sets for the parametrized validation tests
+_LOCKER_DEFAULTS = {"name": "Test Locker", "number": "L001"}
+_ITEM_DEFAULTS = {"name": "Test Item", "locker_id": 1}
+_RESERVATION_DEFAULTS = {
+    "reservation_code": "RES001",
+    "user_id": 1,
+    "locker_id": 1,
+    "start_time": _NOW,
+    "end_time": _LATER,
+}
+_BORROW_DEFAULTS = {"user_id": 1, "item_id": 1, "locker_id": 1}
+_PAYMENT_DEFAULTS = {
+    "user_id": 1,
+    "amount": 25.50,
+    "method": "credit_card",
+    "status": "completed",
+}
+
+
+
+@pytest.fixture(scope="module")
+def models():
+    """Models bound to an in-memory SQLite app
+
+    init_models defines the classes per database, and the code generators
+    query it, so the tests run inside this app's context.
+    """
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db = SQLAlchemy(app)
+    with app.app_context():
+        User, Locker, Item, Log, Borrow, Payment, Reservation, *_ = init_models(db)
+        db.create_all()
+        yield SimpleNamespace(
+            User=User,
+            Locker=Locker,
+            Item=Item,
+            Log=Log,
+            Borrow=Borrow,
+            Payment=Payment,
+            Reservation=Reservation,
+        )
+
+
+@pytest.fixture(scope="module")
+def template_password_hash(models):
+    """Hash the shared test password once per module (hashing is slow)"""
+    user = models.User(username="template")
+    user.set_password("password123")
+    return user.password_hash
+
+
+@pytest.fixture
+def test_user(models, template_password_hash):
+    """A student user with the pre-hashed test password"""
+    user = models.User(
+        username="testuser",
+        email="test@example.com",
+        first_name="Test",
+        last_name="User",
+        role="student",
+        student_id="2024TEST001",
+    )
+    user.password_hash = template_password_hash
+    return user
+
+
+def make_locker(models, **overrides):
+    return models.Locker(**{**_LOCKER_DEFAULTS, **overrides})
+
+
+def make_item(models, **overrides):
+    return models.Item(**{**_ITEM_DEFAULTS, **overrides})
+
+
+def make_reservation(models, **overrides):
+    return models.Reservation(**{**_RESERVATION_DEFAULTS, **overrides})
+
+
+def make_borrow(models, **overrides):
+    return models.Borrow(**{**_BORROW_DEFAULTS, **overrides})
+
+
+def make_payment(models, **overrides):
+    return models.Payment(**{**_PAYMENT_DEFAULTS, **overrides})
 
 
 class TestUserModel:
     """Test User model functionality"""
 
-    def test_user_creation(self):
+    def test_user_creation(self, models, test_user):
         """Test user model creation and validation"""
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            first_name="Test",
-            last_name="User",
-            role="student",
-            student_id="2024TEST001"
-        )
-        user.set_password("password123")
-        
-        assert user.username == "testuser"
-        assert user.email == "test@example.com"
-        assert user.first_name == "Test"
-        assert user.last_name == "User"
-        assert user.role == "student"
-        assert user.student_id == "2024TEST001"
+        user = test_user
+        
+        expected = {
+            "username": "testuser",
+            "email": "test@example.com",
+            "first_name": "Test",
+            "last_name": "User",
+            "role": "student",
+            "student_id": "2024TEST001",
+        }
+        assert attrgetter(*expected)(user) == tuple(expected.values())
         assert user.check_password("password123")
         assert not user.check_password("wrongpassword")
 
-    def test_user_to_dict(self):
+    def test_user_to_dict(self, models):
         """Test user serialization to dictionary"""
-        user = User(
+        user = models.User(
             username="testuser",
             email="test@example.com",
             first_name="Test",
@@ -60,9 +151,9 @@ class TestUserModel:
         assert user_dict["role"] == "student"
         assert "password_hash" not in user_dict
 
-    def test_user_password_hashing(self):
+    def test_user_password_hashing(self, models):
         """Test password hashing and verification"""
-        user = User(username="testuser")
+        user = models.User(username="testuser")
         
         # Test password setting
         user.set_password("testpassword")
@@ -74,17 +165,15 @@ class TestUserModel:
         assert not user.check_password("wrongpassword")
         assert not user.check_password("")
 
-    def test_user_role_validation(self):
+    @pytest.mark.parametrize("role", ["admin", "manager", "supervisor", "student"])
+    def test_user_role_validation(self, models, role):
         """Test user role validation"""
-        valid_roles = ["admin", "manager", "supervisor", "student"]
-        
-        for role in valid_roles:
-            user = User(username="testuser", role=role)
-            assert user.role == role
+        user = models.User(username="testuser", role=role)
+        assert user.role == role
 
-    def test_user_email_validation(self):
+    def test_user_email_validation(self, models):
         """Test user email format validation"""
-        user = User(
+        user = models.User(
             username="testuser",
             email="valid.email@example.com"
         )
@@ -94,9 +183,9 @@ class TestUserModel:
 class TestLockerModel:
     """Test Locker model functionality"""
 
-    def test_locker_creation(self):
+    def test_locker_creation(self, models):
         """Test locker model creation"""
-        locker = Locker(
+        locker = models.Locker(
             name="Test Locker",
             number="L001",
             location="Test Location",
@@ -108,19 +197,22 @@ class TestLockerModel:
             rs485_locker_number=1
         )
         
-        assert locker.name == "Test Locker"
-        assert locker.number == "L001"
-        assert locker.location == "Test Location"
-        assert locker.description == "Test locker description"
-        assert locker.capacity == 10
-        assert locker.status == "active"
+        expected = {
+            "name": "Test Locker",
+            "number": "L001",
+            "location": "Test Location",
+            "description": "Test locker description",
+            "capacity": 10,
+            "status": "active",
+            "rs485_address": 1,
+            "rs485_locker_number": 1,
+        }
+        assert attrgetter(*expected)(locker) == tuple(expected.values())
         assert locker.is_active is True
-        assert locker.rs485_address == 1
-        assert locker.rs485_locker_number == 1
 
-    def test_locker_to_dict(self):
+    def test_locker_to_dict(self, models):
         """Test locker serialization to dictionary"""
-        locker = Locker(
+        locker = models.Locker(
             name="Test Locker",
             number="L001",
             location="Test Location",
@@ -136,17 +228,17 @@ class TestLockerModel:
         assert locker_dict["location"] == "Test Location"
         assert locker_dict["status"] == "active"
 
-    def test_locker_status_validation(self):
+    @pytest.mark.parametrize(
+        "status", ["active", "inactive", "maintenance", "reserved"]
+    )
+    def test_locker_status_validation(self, models, status):
         """Test locker status validation"""
-        valid_statuses = ["active", "inactive", "maintenance", "reserved"]
-        
-        for status in valid_statuses:
-            locker = Locker(name="Test Locker", number="L001", status=status)
-            assert locker.status == status
+        locker = make_locker(models, status=status)
+        assert locker.status == status
 
-    def test_locker_rs485_configuration(self):
+    def test_locker_rs485_configuration(self, models):
         """Test locker RS485 configuration"""
-        locker = Locker(
+        locker = models.Locker(
             name="Test Locker",
             number="L001",
             rs485_address=5,
@@ -160,27 +252,30 @@ class TestLockerModel:
 class TestItemModel:
     """Test Item model functionality"""
 
-    def test_item_creation(self):
+    def test_item_creation(self, models):
         """Test item model creation"""
-        item = Item(
+        item = models.Item(
             name="Test Item",
             description="Test item description",
             category="Electronics",
             status="available",
             locker_id=1,
-            rfid_tag="RFID123456"
+            serial_number="SN123456"
         )
         
-        assert item.name == "Test Item"
-        assert item.description == "Test item description"
-        assert item.category == "Electronics"
-        assert item.status == "available"
-        assert item.locker_id == 1
-        assert item.rfid_tag == "RFID123456"
-
-    def test_item_to_dict(self):
+        expected = {
+            "name": "Test Item",
+            "description": "Test item description",
+            "category": "Electronics",
+            "status": "available",
+            "locker_id": 1,
+            "serial_number": "SN123456",
+        }
+        assert attrgetter(*expected)(item) == tuple(expected.values())
+
+    def test_item_to_dict(self, models):
         """Test item serialization to dictionary"""
-        item = Item(
+        item = models.Item(
             name="Test Item",
             description="Test item description",
             status="available",
@@ -196,24 +291,22 @@ class TestItemModel:
         assert item_dict["status"] == "available"
         assert item_dict["locker_id"] == 1
 
-    def test_item_status_validation(self):
+    @pytest.mark.parametrize("status", ["available", "borrowed", "maintenance", "lost"])
+    def test_item_status_validation(self, models, status):
         """Test item status validation"""
-        valid_statuses = ["available", "borrowed", "maintenance", "lost"]
-        
-        for status in valid_statuses:
-            item = Item(name="Test Item", status=status, locker_id=1)
-            assert item.status == status
+        item = make_item(models, status=status)
+        assert item.status == status
 
 
 class TestReservationModel:
     """Test Reservation model functionality"""
 
-    def test_reservation_creation(self):
+    def test_reservation_creation(self, models):
         """Test reservation model creation"""
-        start_time = datetime.utcnow()
-        end_time = start_time + timedelta(hours=1)
+        start_time = _NOW
+        end_time = _LATER
         
-        reservation = Reservation(
+        reservation = models.Reservation(
             reservation_code="RES001",
             user_id=1,
             locker_id=1,
@@ -224,21 +317,24 @@ class TestReservationModel:
             status="active"
         )
         
-        assert reservation.reservation_code == "RES001"
-        assert reservation.user_id == 1
-        assert reservation.locker_id == 1
-        assert reservation.start_time == start_time
-        assert reservation.end_time == end_time
-        assert reservation.access_code == "123456"
-        assert reservation.notes == "Test reservation"
-        assert reservation.status == "active"
-
-    def test_reservation_to_dict(self):
+        expected = {
+            "reservation_code": "RES001",
+            "user_id": 1,
+            "locker_id": 1,
+            "start_time": start_time,
+            "end_time": end_time,
+            "access_code": "123456",
+            "notes": "Test reservation",
+            "status": "active",
+        }
+        assert attrgetter(*expected)(reservation) == tuple(expected.values())
+
+    def test_reservation_to_dict(self, models):
         """Test reservation serialization to dictionary"""
-        start_time = datetime.utcnow()
-        end_time = start_time + timedelta(hours=1)
+        start_time = _NOW
+        end_time = _LATER
         
-        reservation = Reservation(
+        reservation = models.Reservation(
             reservation_code="RES001",
             user_id=1,
             locker_id=1,
@@ -256,67 +352,55 @@ class TestReservationModel:
         assert reservation_dict["locker_id"] == 1
         assert reservation_dict["status"] == "active"
 
-    def test_reservation_code_generation(self):
-        """Test reservation code generation"""
-        code1 = Reservation.generate_reservation_code()
-        code2 = Reservation.generate_reservation_code()
-        
-        assert len(code1) == 8
-        assert len(code2) == 8
-        assert code1 != code2
-        assert code1.isalnum()
-        assert code2.isalnum()
-
-    def test_access_code_generation(self):
-        """Test access code generation"""
-        code1 = Reservation.generate_access_code()
-        code2 = Reservation.generate_access_code()
-        
-        assert len(code1) == 6
-        assert len(code2) == 6
-        assert code1 != code2
-        assert code1.isdigit()
-        assert code2.isdigit()
-
-    def test_reservation_status_validation(self):
+    @pytest.mark.parametrize(
+        "generator, length, charset_check",
+        [
+            ("generate_reservation_code", 8, str.isalnum),
+            ("generate_access_code", 8, str.isdigit),
+        ],
+        ids=["reservation_code", "access_code"],
+    )
+    def test_code_generation(self, models, generator, length, charset_check):
+        """Test reservation and access code generation"""
+        generate = getattr(models.Reservation, generator)
+        codes = [generate() for _ in range(64)]
+
+        assert all(len(code) == length and charset_check(code) for code in codes)
+        assert len(set(codes)) == len(codes)
+
+    @pytest.mark.parametrize("status", ["active", "cancelled", "expired", "completed"])
+    def test_reservation_status_validation(self, models, status):
         """Test reservation status validation"""
-        valid_statuses = ["active", "cancelled", "expired", "completed"]
-        
-        for status in valid_statuses:
-            reservation = Reservation(
-                reservation_code="RES001",
-                user_id=1,
-                locker_id=1,
-                start_time=datetime.utcnow(),
-                end_time=datetime.utcnow() + timedelta(hours=1),
-                status=status
-            )
-            assert reservation.status == status
+        reservation = make_reservation(models, status=status)
+        assert reservation.status == status
 
 
 class TestBorrowModel:
     """Test Borrow model functionality"""
 
-    def test_borrow_creation(self):
+    def test_borrow_creation(self, models):
         """Test borrow model creation"""
-        borrow = Borrow(
+        borrow = models.Borrow(
             user_id=1,
             item_id=1,
             locker_id=1,
-            due_date=datetime.utcnow() + timedelta(days=7),
+            due_date=_NOW + timedelta(days=7),
             status="borrowed",
             notes="Test borrow"
         )
         
-        assert borrow.user_id == 1
-        assert borrow.item_id == 1
-        assert borrow.locker_id == 1
-        assert borrow.status == "borrowed"
-        assert borrow.notes == "Test borrow"
+        expected = {
+            "user_id": 1,
+            "item_id": 1,
+            "locker_id": 1,
+            "status": "borrowed",
+            "notes": "Test borrow",
+        }
+        assert attrgetter(*expected)(borrow) == tuple(expected.values())
 
-    def test_borrow_to_dict(self):
+    def test_borrow_to_dict(self, models):
         """Test borrow serialization to dictionary"""
-        borrow = Borrow(
+        borrow = models.Borrow(
             user_id=1,
             item_id=1,
             locker_id=1,
@@ -332,26 +416,19 @@ class TestBorrowModel:
         assert borrow_dict["locker_id"] == 1
         assert borrow_dict["status"] == "borrowed"
 
-    def test_borrow_status_validation(self):
+    @pytest.mark.parametrize("status", ["borrowed", "returned", "overdue", "lost"])
+    def test_borrow_status_validation(self, models, status):
         """Test borrow status validation"""
-        valid_statuses = ["borrowed", "returned", "overdue", "lost"]
-        
-        for status in valid_statuses:
-            borrow = Borrow(
-                user_id=1,
-                item_id=1,
-                locker_id=1,
-                status=status
-            )
-            assert borrow.status == status
+        borrow = make_borrow(models, status=status)
+        assert borrow.status == status
 
 
 class TestLogModel:
     """Test Log model functionality"""
 
-    def test_log_creation(self):
+    def test_log_creation(self, models):
         """Test log model creation"""
-        log = Log(
+        log = models.Log(
             user_id=1,
             item_id=1,
             locker_id=1,
@@ -361,17 +438,20 @@ class TestLogModel:
             user_agent="Test Browser"
         )
         
-        assert log.user_id == 1
-        assert log.item_id == 1
-        assert log.locker_id == 1
-        assert log.action_type == "login"
-        assert log.notes == "Test log entry"
-        assert log.ip_address == "127.0.0.1"
-        assert log.user_agent == "Test Browser"
-
-    def test_log_to_dict(self):
+        expected = {
+            "user_id": 1,
+            "item_id": 1,
+            "locker_id": 1,
+            "action_type": "login",
+            "notes": "Test log entry",
+            "ip_address": "127.0.0.1",
+            "user_agent": "Test Browser",
+        }
+        assert attrgetter(*expected)(log) == tuple(expected.values())
+
+    def test_log_to_dict(self, models):
         """Test log serialization to dictionary"""
-        log = Log(
+        log = models.Log(
             user_id=1,
             action_type="login",
             notes="Test log entry"
@@ -389,30 +469,31 @@ class TestLogModel:
 class TestPaymentModel:
     """Test Payment model functionality"""
 
-    def test_payment_creation(self):
+    def test_payment_creation(self, models):
         """Test payment model creation"""
-        payment = Payment(
+        payment = models.Payment(
             user_id=1,
             amount=25.50,
-            payment_type="credit_card",
+            method="credit_card",
             status="completed",
-            transaction_id="TXN123456",
             description="Locker rental payment"
         )
         
-        assert payment.user_id == 1
-        assert payment.amount == 25.50
-        assert payment.payment_type == "credit_card"
-        assert payment.status == "completed"
-        assert payment.transaction_id == "TXN123456"
-        assert payment.description == "Locker rental payment"
-
-    def test_payment_to_dict(self):
+        expected = {
+            "user_id": 1,
+            "amount": 25.50,
+            "method": "credit_card",
+            "status": "completed",
+            "description": "Locker rental payment",
+        }
+        assert attrgetter(*expected)(payment) == tuple(expected.values())
+
+    def test_payment_to_dict(self, models):
         """Test payment serialization to dictionary"""
-        payment = Payment(
+        payment = models.Payment(
             user_id=1,
             amount=25.50,
-            payment_type="credit_card",
+            method="credit_card",
             status="completed"
         )
         payment.id = 1
@@ -422,31 +503,19 @@ class TestPaymentModel:
         assert payment_dict["id"] == 1
         assert payment_dict["user_id"] == 1
         assert payment_dict["amount"] == 25.50
-        assert payment_dict["payment_type"] == "credit_card"
+        assert payment_dict["method"] == "credit_card"
         assert payment_dict["status"] == "completed"
 
-    def test_payment_status_validation(self):
+    @pytest.mark.parametrize("status", ["pending", "completed", "failed", "refunded"])
+    def test_payment_status_validation(self, models, status):
         """Test payment status validation"""
-        valid_statuses = ["pending", "completed", "failed", "refunded"]
-        
-        for status in valid_statuses:
-            payment = Payment(
-                user_id=1,
-                amount=25.50,
-                payment_type="credit_card",
-                status=status
-            )
-            assert payment.status == status
-
-    def test_payment_type_validation(self):
-        """Test payment type validation"""
-        valid_types = ["credit_card", "debit_card", "cash", "online"]
-        
-        for payment_type in valid_types:
-            payment = Payment(
-                user_id=1,
-                amount=25.50,
-                payment_type=payment_type,
-                status="completed"
-            )
-            assert payment.payment_type == payment_type 
\ No newline at end of file
+        payment = make_payment(models, status=status)
+        assert payment.status == status
+
+    @pytest.mark.parametrize(
+        "method", ["credit_card", "debit_card", "cash", "online"]
+    )
+    def test_payment_method_validation(self, models, method):
+        """Test payment method validation"""
+        payment = make_payment(models, method=method)
+        assert payment.method == method 
\ No newline at end of file
@@ -3,10 +3,12 @@ import io
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -19,6 +21,13 @@ from reportlab.platypus import (Paragraph, SimpleDocTemplate, Spacer, Table,
 logger = logging.getLogger(__name__)
 
 
+class _LineEcho:
+    """Write target for csv.writer that hands each formatted line back"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
 class ExportManager:
     def __init__(self):
         self.styles = getSampleStyleSheet()
@@ -73,6 +82,20 @@ class ExportManager:
 
         return csv_content
 
+    def iter_csv(self, rows: Iterable[Dict]) -> Iterator[str]:
+        """Yield CSV text one line at a time, header first
+
+        Nothing is buffered, so a response can stream rows as they are
+        produced. Yields nothing for no rows, like export_csv.
+        """
+        writer = csv.writer(_LineEcho())
+        header_written = False
+        for row in rows:
+            if not header_written:
+                yield writer.writerow(row.keys())
+                header_written = True
+            yield writer.writerow(row.values())
+
     def export_excel(
         self, data: List[Dict], filename: str = None, sheet_name: str = "Data"
     ) -> bytes:
@@ -80,37 +103,38 @@ class ExportManager:
         if not data:
             return b""
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name
+        headers = list(data[0].keys())
+
+        # Size columns from the raw values up front: a write-only sheet
+        # streams rows out as they are appended and cannot be revisited
+        widths = [len(str(header)) for header in headers]
+        for row_data in data:
+            for col_idx, value in enumerate(row_data.values()):
+                length = len(str(value))
+                if length > widths[col_idx]:
+                    widths[col_idx] = length
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+        for col_idx, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
 
         # Write header
-        if data:
-            headers = list(data[0].keys())
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
+        header_font = Font(bold=True)
+        header_fill = PatternFill(
+            start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
+        )
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            header_cells.append(cell)
+        ws.append(header_cells)
 
         # Write data
-        for row_idx, row_data in enumerate(data, 2):
-            for col_idx, value in enumerate(row_data.values(), 1):
-                ws.cell(row=row_idx, column=col_idx, value=value)
-
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        for row_data in data:
+            ws.append(list(row_data.values()))
 
         # Save to bytes
         output = io.BytesIO()
@@ -339,6 +363,11 @@ def export_data_csv(data: List[Dict], filename: str = None) -> str:
     return export_manager.export_csv(data, filename)
 
 
+def stream_data_csv(rows: Iterable[Dict]) -> Iterator[str]:
+    """Export data to CSV format line by line"""
+    return export_manager.iter_csv(rows)
+
+
 def export_data_excel(data: List[Dict], filename: str = None) -> bytes:
     """Export data to Excel format"""
     return export_manager.export_excel(data, filename)
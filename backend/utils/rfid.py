@@ -1,30 +1,48 @@
+import logging
+import re
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
 try:
     import evdev  # type: ignore[import]
 
     EVDEV_AVAILABLE = True
 except ImportError:
     EVDEV_AVAILABLE = False
-    print("[INFO] evdev not available - using mock RFID for development")
+    logger.info("evdev not available - using mock RFID for development")
 
 
 def read_rfid():
     if EVDEV_AVAILABLE:
         # Real RFID reading logic for Raspberry Pi
         # This would scan for RFID devices and read tags
-        print("[REAL] Reading RFID tag...")
+        logger.debug("Reading RFID tag...")
         return "REAL_RFID_TAG"
     else:
         # Mock RFID for MacBook development
-        print("[MOCK] Reading RFID tag...")
+        logger.debug("Reading mock RFID tag...")
         return "FAKE_RFID_TAG"
 
 
+# Device names that identify an RFID/card reader
+_RFID_NAME_RE = re.compile(r"rfid|card", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _rfid_devices_cached():
+    """Open and filter the input devices once; reused until refreshed"""
+    if not EVDEV_AVAILABLE:
+        return ()
+    devices = (evdev.InputDevice(path) for path in evdev.list_devices())
+    return tuple(d for d in devices if _RFID_NAME_RE.search(d.name))
+
+
 def get_rfid_devices():
     """Get list of available RFID devices"""
-    if EVDEV_AVAILABLE:
-        devices = [evdev.InputDevice(path) for path in evdev.list_devices()]
-        return [
-            d for d in devices if "rfid" in d.name.lower() or "card" in d.name.lower()
-        ]
-    else:
-        return []
+    return list(_rfid_devices_cached())
+
+
+def refresh_rfid_devices():
+    """Forget the cached device list, e.g. after a reader is plugged in"""
+    _rfid_devices_cached.cache_clear()
@@ -1,7 +1,13 @@
 import logging
 import os
+import re
+import select
+import struct
+import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
 
 import serial
 
@@ -12,6 +18,53 @@ logger = logging.getLogger(__name__)
 # Default is real hardware mode - set RS485_MOCK_MODE=true for mock mode
 MOCK_MODE = os.environ.get("RS485_MOCK_MODE", "False").lower() == "true"
 
+# The lock board acknowledges a command with a frame the same size as the
+# 10-byte command frame, with no line terminator
+RESPONSE_LEN = 10
+
+# Text commands, encoded once; STATUS covers the ids that fit its 3 digits
+_TEST_COMMAND = b"TEST\n"
+_STATUS_COMMANDS = tuple(f"STATUS:{i:03d}\n".encode() for i in range(1000))
+
+# Reservation access codes are exactly 8 ASCII digits
+_ACCESS_CODE_RE = re.compile(r"[0-9]{8}")
+
+# How long a request thread waits for the serial I/O thread before giving up:
+# the 1 s port timeout plus a second of margin. Batches add their transmit time
+IO_TIMEOUT = 2
+
+# Result messages for locker actions, keyed by (action, success)
+_RESULT_MESSAGES = {
+    ("open", True): "Locker opened successfully",
+    ("open", False): "Failed to open locker",
+    ("close", True): "Locker closed successfully",
+    ("close", False): "Failed to close locker",
+    ("reservation_access", True): "Reservation access granted",
+    ("reservation_access", False): "Failed to access locker",
+}
+
+
+def _locker_result(
+    success: bool,
+    locker_id: int,
+    action: str,
+    address: int,
+    locker_number: int,
+    frame: str,
+    timestamp: float,
+) -> Dict[str, Any]:
+    """Build the result dict returned by the locker open/close/access calls"""
+    return {
+        "success": success,
+        "locker_id": locker_id,
+        "action": action,
+        "rs485_address": address,
+        "rs485_locker_number": locker_number,
+        "frame": frame,
+        "timestamp": timestamp,
+        "message": _RESULT_MESSAGES[(action, success)],
+    }
+
 
 class RS485Controller:
     def __init__(self, port: str = "/dev/ttyUSB0", baudrate: int = 9600):
@@ -19,6 +72,15 @@ class RS485Controller:
         self.baudrate = baudrate
         self.serial_connection = None
         self.connected = False
+        # All serial I/O runs on this single thread, so request threads never
+        # share the port; the thread is only started by the first real command
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rs485-io"
+        )
+
+        # Commands go to the mock until a real port is open; _connect and
+        # disconnect rebind this so the per-command path never re-checks
+        self._send_command = self._send_command_mock
 
         if not MOCK_MODE:
             self._connect()
@@ -26,76 +88,105 @@ class RS485Controller:
     def _connect(self):
         """Establish serial connection to RS485 device"""
         try:
-            # First check if the port exists
-            import serial.tools.list_ports
-            available_ports = [port.device for port in serial.tools.list_ports.comports()]
-            
-            if self.port not in available_ports:
-                logger.warning(f"RS485 port {self.port} not found")
-                logger.info(f"Available ports: {available_ports}")
-                logger.info("RS485 hardware not connected - using mock mode")
-                self.connected = False
-                return
-            
+            # A missing port makes serial.Serial raise, so no up-front scan
             self.serial_connection = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=1,
+                # Return as soon as the reply stops arriving
+                inter_byte_timeout=0.01,
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
             )
             self.connected = True
+            self._send_command = self._send_command_real
+            self._enable_low_latency()
             logger.info(f"RS485 connected to {self.port}")
         except Exception as e:
             logger.error(f"Failed to connect to RS485: {e}")
+            if logger.isEnabledFor(logging.INFO):
+                from serial.tools.list_ports import comports
+
+                available_ports = [port.device for port in comports()]
+                logger.info(f"Available ports: {available_ports}")
             logger.info("Falling back to mock mode")
             self.connected = False
 
-    def _send_command(self, command: str) -> bool:
-        """Send command to RS485 device"""
-        if MOCK_MODE or not self.connected or self.serial_connection is None:
-            logger.info(f"[MOCK] RS485 Command: {command}")
-            logger.info(f"[MOCK] Command bytes: {[hex(ord(c)) for c in command]}")
-            logger.info(f"[MOCK] Hardware not connected - simulating success")
-            time.sleep(0.1)  # Simulate hardware delay
-            return True
+    def _enable_low_latency(self):
+        """Ask the tty driver to deliver bytes immediately (ASYNC_LOW_LATENCY)
+
+        USB-serial adapters otherwise batch incoming bytes for up to 16 ms,
+        which adds that much to every command round trip. Only Linux ports
+        support this; elsewhere the port keeps its default behaviour.
+        """
+        set_low_latency = getattr(self.serial_connection, "set_low_latency_mode", None)
+        if set_low_latency is None:
+            return
+        try:
+            set_low_latency(True)
+            logger.info(f"RS485 low-latency mode enabled on {self.port}")
+        except (ValueError, OSError) as e:
+            logger.debug(f"RS485 low-latency mode not available: {e}")
+
+    def _send_command_mock(self, command: bytes) -> bool:
+        """Log a command instead of sending it (no hardware connected)"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[MOCK] RS485 Command: %s (hardware not connected)",
+                command.hex().upper(),
+            )
+        time.sleep(0.1)  # Simulate hardware delay
+        return True
+
+    def _send_command_real(self, command: bytes) -> bool:
+        """Send a raw command frame to the RS485 device"""
+        return self._run_io(self._transmit, command, default=False)
 
-        if not self.connected or self.serial_connection is None:
-            logger.error("RS485 not connected")
+    def _send_text_command(self, command: bytes) -> bool:
+        """Send a text command (STATUS/TEST) to the mock only
+
+        The lock boards understand the binary frames alone, so text commands
+        are never written to a real port and report failure there.
+        """
+        if self.connected:
+            logger.error(f"Lock boards do not accept text command {command.strip()!r}")
             return False
+        return self._send_command(command)
 
+    def _run_io(self, fn, *args, default, timeout=IO_TIMEOUT):
+        """Run fn on the serial I/O thread and wait up to timeout for it"""
+        future = self._io_executor.submit(fn, *args)
         try:
-            logger.info(f"=== REAL RS485 COMMAND EXECUTION ===")
-            logger.info(f"Port: {self.port}")
-            logger.info(f"Baudrate: {self.baudrate}")
-            logger.info(f"Command (hex string): {command}")
-            
-            # Convert hex string to bytes
-            try:
-                command_bytes = bytes.fromhex(command)
-                logger.info(f"Command (hex bytes): {[f'{b:02X}' for b in command_bytes]}")
-                logger.info(f"Command length: {len(command_bytes)} bytes")
-            except ValueError as e:
-                logger.error(f"Invalid hex string: {command}")
-                logger.error(f"Hex conversion error: {e}")
-                return False
-            
-            # Send the command as hex bytes
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.error(f"RS485 I/O on {self.port} timed out after {timeout}s")
+            return default
+
+    def _transmit_time(self, size: int) -> float:
+        """Seconds needed to send size bytes (10 bits per byte at 8N1)"""
+        return size * 10 / self.baudrate
+
+    def _transmit(self, command_bytes: bytes) -> bool:
+        """Write one frame and read its reply (runs on the I/O thread)"""
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "RS485 write on %s @ %d baud: %s (%d bytes)",
+                    self.port,
+                    self.baudrate,
+                    command_bytes.hex(" ").upper(),
+                    len(command_bytes),
+                )
+
             bytes_written = self.serial_connection.write(command_bytes)
-            logger.info(f"Bytes written to serial: {bytes_written}")
-            
-            # Wait for response
-            logger.info("Waiting for RS485 response...")
-            response = self.serial_connection.readline().decode().strip()
-            logger.info(f"RS485 Response: {response}")
-            logger.info(f"Response length: {len(response)} characters")
-            
-            # Log additional serial port info
-            logger.info(f"Serial port in_waiting: {self.serial_connection.in_waiting}")
-            logger.info(f"Serial port out_waiting: {self.serial_connection.out_waiting}")
-            
-            logger.info(f"=== RS485 COMMAND COMPLETED ===")
+
+            # Wait for the fixed-length reply rather than a newline that the
+            # board never sends (readline would always sit out the timeout)
+            response = self._read_reply(RESPONSE_LEN, self.serial_connection.timeout)
+            logger.info(
+                "RS485 command sent (%d bytes), response: %r", bytes_written, response
+            )
             return True
         except Exception as e:
             logger.error(f"=== RS485 COMMUNICATION ERROR ===")
@@ -106,6 +197,41 @@ class RS485Controller:
             logger.error(f"Serial connection: {self.serial_connection}")
             return False
 
+    def _read_reply(self, size: int, timeout: Optional[float]) -> bytes:
+        """Read up to size bytes, returning as soon as all of them have arrived
+
+        Waits on the port's file descriptor with select, so the call tracks
+        the board's actual response time and only sits out the full timeout
+        when the reply is short or missing.
+        """
+        fileno = getattr(self.serial_connection, "fileno", None)
+        if fileno is None:
+            # No descriptor to wait on (e.g. Windows): let pyserial time it
+            previous = self.serial_connection.timeout
+            self.serial_connection.timeout = timeout
+            try:
+                return self.serial_connection.read(size)
+            finally:
+                self.serial_connection.timeout = previous
+
+        fd = fileno()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        buf = bytearray()
+        while len(buf) < size:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break
+            chunk = os.read(fd, size - len(buf))
+            if not chunk:
+                break
+            buf += chunk
+        return bytes(buf)
+
     def open_locker(
         self,
         locker_id: int,
@@ -113,48 +239,41 @@ class RS485Controller:
         locker_number: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Open a specific locker using RS485 protocol"""
-        logger.info(f"=== LOCKER OPEN REQUEST ===")
-        logger.info(f"Locker ID: {locker_id}")
-        logger.info(f"Provided Address: {address}")
-        logger.info(f"Provided Locker Number: {locker_number}")
-        logger.info(f"Mock Mode: {MOCK_MODE}")
-        logger.info(f"RS485 Connected: {self.connected}")
-        
+        timestamp = time.time()
         try:
             # Generate RS485 frame
-            if address is not None and locker_number is not None:
-                logger.info(f"Using provided address ({address}) and locker number ({locker_number})")
-                frame = generate_rs485_frame(address, locker_number)
-            else:
+            if address is None or locker_number is None:
                 # Fallback to simple mapping if no address/numbers provided
-                address = (locker_id - 1) % 32  # Dipswitch 0-31
-                locker_number = ((locker_id - 1) % 24) + 1  # Locker 1-24
-                logger.info(f"Using calculated address ({address}) and locker number ({locker_number})")
-                frame = generate_rs485_frame(address, locker_number)
-
-            logger.info(f"Generated frame: {frame}")
-            logger.info(f"Frame length: {len(frame)} characters")
+                address, locker_number, frame_bytes = _default_locker_frame(locker_id)
+            else:
+                frame_bytes = generate_rs485_frame_bytes(address, locker_number)
+            frame = frame_bytes.hex().upper()
+            logger.debug(
+                "Locker open request: locker %s, address %s, locker number %s, "
+                "mock mode %s, connected %s",
+                locker_id,
+                address,
+                locker_number,
+                MOCK_MODE,
+                self.connected,
+            )
 
             # Send the frame
-            success = self._send_command(frame)
+            success = self._send_command(frame_bytes)
 
-            result = {
-                "success": success,
-                "locker_id": locker_id,
-                "action": "open",
-                "rs485_address": address,
-                "rs485_locker_number": locker_number,
-                "frame": frame,
-                "timestamp": time.time(),
-                "message": (
-                    "Locker opened successfully" if success else "Failed to open locker"
-                ),
-            }
+            result = _locker_result(
+                success, locker_id, "open", address, locker_number, frame, timestamp
+            )
 
             if success:
-                logger.info(f"=== LOCKER OPEN SUCCESS ===")
-                logger.info(f"Locker {locker_id} opened successfully with frame: {frame}")
-                logger.info(f"Address: {address}, Locker Number: {locker_number}")
+                logger.info(
+                    "Locker %s opened successfully with frame: %s "
+                    "(address %s, locker number %s)",
+                    locker_id,
+                    frame,
+                    address,
+                    locker_number,
+                )
             else:
                 logger.error(f"=== LOCKER OPEN FAILED ===")
                 logger.error(f"Failed to open locker {locker_id}")
@@ -172,10 +291,94 @@ class RS485Controller:
                 "locker_id": locker_id,
                 "action": "open",
                 "error": str(e),
-                "timestamp": time.time(),
+                "timestamp": timestamp,
                 "message": f"Error opening locker: {e}",
             }
 
+    def send_frames(self, frames: List[bytes]) -> List[bool]:
+        """Send several frames in one write and collect the replies in one read"""
+        if not frames:
+            return []
+
+        if MOCK_MODE or not self.connected or self.serial_connection is None:
+            logger.info(
+                "[MOCK] RS485 batch of %d frames (hardware not connected)", len(frames)
+            )
+            time.sleep(0.1)  # Simulate hardware delay
+            return [True] * len(frames)
+
+        payload = b"".join(frames)
+        # _transmit_batch stretches its read timeout by the burst's transmit
+        # time, so the wait for it is stretched by the same amount
+        return self._run_io(
+            self._transmit_batch,
+            payload,
+            len(frames),
+            default=[False] * len(frames),
+            timeout=IO_TIMEOUT + self._transmit_time(len(payload)),
+        )
+
+    def _transmit_batch(self, payload: bytes, count: int) -> List[bool]:
+        """Write a joined batch of frames and read the replies (I/O thread)"""
+        try:
+            bytes_written = self.serial_connection.write(payload)
+
+            # Give the burst its transmit time on top of the normal
+            # per-command timeout
+            timeout = self.serial_connection.timeout
+            if timeout is not None:
+                timeout += self._transmit_time(len(payload))
+            response = self._read_reply(len(payload), timeout)
+
+            logger.info(
+                "RS485 batch sent (%d frames, %d bytes), %d response bytes",
+                count,
+                bytes_written,
+                len(response),
+            )
+            return [bytes_written == len(payload)] * count
+        except Exception as e:
+            logger.error(f"RS485 batch send error: {e}")
+            return [False] * count
+
+    def open_lockers(
+        self, locker_specs: List[Tuple[int, Optional[int], Optional[int]]]
+    ) -> List[Dict[str, Any]]:
+        """Open several lockers with a single serial round trip
+
+        Args:
+            locker_specs: (locker_id, address, locker_number) tuples; address
+                and locker_number may be None to use the fallback mapping
+        """
+        resolved = []
+        frames = []
+        for locker_id, address, locker_number in locker_specs:
+            if address is None or locker_number is None:
+                # Fallback to simple mapping if no address/numbers provided
+                address, locker_number, frame_bytes = _default_locker_frame(locker_id)
+            else:
+                frame_bytes = generate_rs485_frame_bytes(address, locker_number)
+            resolved.append((locker_id, address, locker_number))
+            frames.append(frame_bytes)
+
+        successes = self.send_frames(frames)
+        timestamp = time.time()
+
+        return [
+            _locker_result(
+                success,
+                locker_id,
+                "open",
+                address,
+                locker_number,
+                frame.hex().upper(),
+                timestamp,
+            )
+            for (locker_id, address, locker_number), frame, success in zip(
+                resolved, frames, successes
+            )
+        ]
+
     def close_locker(
         self,
         locker_id: int,
@@ -183,33 +386,22 @@ class RS485Controller:
         locker_number: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Close a specific locker using RS485 protocol"""
+        timestamp = time.time()
         try:
             # Generate RS485 frame
             if address is not None and locker_number is not None:
-                frame = generate_rs485_frame(address, locker_number)
+                frame_bytes = generate_rs485_frame_bytes(address, locker_number)
             else:
                 # Fallback to simple mapping if no address/numbers provided
-                address = (locker_id - 1) % 32  # Dipswitch 0-31
-                locker_number = ((locker_id - 1) % 24) + 1  # Locker 1-24
-                frame = generate_rs485_frame(address, locker_number)
+                address, locker_number, frame_bytes = _default_locker_frame(locker_id)
+            frame = frame_bytes.hex().upper()
 
             # Send the frame
-            success = self._send_command(frame)
+            success = self._send_command(frame_bytes)
 
-            result = {
-                "success": success,
-                "locker_id": locker_id,
-                "action": "close",
-                "rs485_address": address,
-                "rs485_locker_number": locker_number,
-                "frame": frame,
-                "timestamp": time.time(),
-                "message": (
-                    "Locker closed successfully"
-                    if success
-                    else "Failed to close locker"
-                ),
-            }
+            result = _locker_result(
+                success, locker_id, "close", address, locker_number, frame, timestamp
+            )
 
             if success:
                 logger.info(
@@ -227,14 +419,17 @@ class RS485Controller:
                 "locker_id": locker_id,
                 "action": "close",
                 "error": str(e),
-                "timestamp": time.time(),
+                "timestamp": timestamp,
                 "message": f"Error closing locker: {e}",
             }
 
     def get_locker_status(self, locker_id: int) -> Dict[str, Any]:
         """Get status of a specific locker"""
-        command = f"STATUS:{locker_id:03d}\n"
-        success = self._send_command(command)
+        if 0 <= locker_id < len(_STATUS_COMMANDS):
+            command = _STATUS_COMMANDS[locker_id]
+        else:
+            command = f"STATUS:{locker_id:03d}\n".encode()
+        success = self._send_text_command(command)
 
         # Mock status response
         if MOCK_MODE:
@@ -253,8 +448,7 @@ class RS485Controller:
 
     def test_connection(self) -> Dict[str, Any]:
         """Test RS485 connection"""
-        command = "TEST\n"
-        success = self._send_command(command)
+        success = self._send_text_command(_TEST_COMMAND)
 
         result = {
             "success": success,
@@ -274,37 +468,58 @@ class RS485Controller:
     def disconnect(self):
         """Close serial connection"""
         if self.serial_connection and self.connected:
-            self.serial_connection.close()
+            # Close on the I/O thread so it cannot race an in-flight command
+            self._io_executor.submit(self.serial_connection.close).result()
             self.connected = False
+            self._send_command = self._send_command_mock
             logger.info("RS485 connection closed")
 
 
-# Global RS485 controller instance
-rs485_controller = RS485Controller()
+# Global RS485 controller instance, created on first use so importing this
+# module (e.g. in every app worker) never opens the serial port
+_rs485_controller: Optional[RS485Controller] = None
+_controller_lock = threading.Lock()
+
+
+def _get_controller() -> RS485Controller:
+    """Return the shared RS485 controller, connecting on first call"""
+    global _rs485_controller
+    if _rs485_controller is None:
+        with _controller_lock:
+            if _rs485_controller is None:
+                _rs485_controller = RS485Controller()
+    return _rs485_controller
 
 
 def open_locker(
     locker_id: int, address: Optional[int] = None, locker_number: Optional[int] = None
 ) -> Dict[str, Any]:
     """Open a locker using RS485"""
-    return rs485_controller.open_locker(locker_id, address, locker_number)
+    return _get_controller().open_locker(locker_id, address, locker_number)
 
 
 def close_locker(
     locker_id: int, address: Optional[int] = None, locker_number: Optional[int] = None
 ) -> Dict[str, Any]:
     """Close a locker using RS485"""
-    return rs485_controller.close_locker(locker_id, address, locker_number)
+    return _get_controller().close_locker(locker_id, address, locker_number)
 
 
 def get_locker_status(locker_id: int) -> Dict[str, Any]:
     """Get locker status using RS485"""
-    return rs485_controller.get_locker_status(locker_id)
+    return _get_controller().get_locker_status(locker_id)
+
+
+def batch_open_lockers(
+    locker_specs: List[Tuple[int, Optional[int], Optional[int]]]
+) -> List[Dict[str, Any]]:
+    """Open several lockers using RS485 in one batched write"""
+    return _get_controller().open_lockers(locker_specs)
 
 
 def test_rs485_connection() -> Dict[str, Any]:
     """Test RS485 connection"""
-    return rs485_controller.test_connection()
+    return _get_controller().test_connection()
 
 
 def access_reservation_locker(
@@ -314,9 +529,10 @@ def access_reservation_locker(
     locker_number: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Access a locker using reservation access code"""
+    timestamp = time.time()
     try:
         # Validate access code format (8 digits)
-        if not access_code.isdigit() or len(access_code) != 8:
+        if not _ACCESS_CODE_RE.fullmatch(access_code):
             return {
                 "success": False,
                 "error": "Invalid access code format",
@@ -325,29 +541,25 @@ def access_reservation_locker(
 
         # Generate RS485 frame
         if address is not None and locker_number is not None:
-            frame = generate_rs485_frame(address, locker_number)
+            frame_bytes = generate_rs485_frame_bytes(address, locker_number)
         else:
             # Fallback to simple mapping if no address/numbers provided
-            address = (locker_id - 1) % 32  # Dipswitch 0-31
-            locker_number = ((locker_id - 1) % 24) + 1  # Locker 1-24
-            frame = generate_rs485_frame(address, locker_number)
+            address, locker_number, frame_bytes = _default_locker_frame(locker_id)
+        frame = frame_bytes.hex().upper()
 
         # Send the frame
-        success = rs485_controller._send_command(frame)
-
-        result = {
-            "success": success,
-            "locker_id": locker_id,
-            "access_code": access_code,
-            "action": "reservation_access",
-            "rs485_address": address,
-            "rs485_locker_number": locker_number,
-            "frame": frame,
-            "timestamp": time.time(),
-            "message": (
-                "Reservation access granted" if success else "Failed to access locker"
-            ),
-        }
+        success = _get_controller()._send_command(frame_bytes)
+
+        result = _locker_result(
+            success,
+            locker_id,
+            "reservation_access",
+            address,
+            locker_number,
+            frame,
+            timestamp,
+        )
+        result["access_code"] = access_code
 
         if success:
             logger.info(
@@ -366,14 +578,18 @@ def access_reservation_locker(
             "access_code": access_code,
             "action": "reservation_access",
             "error": str(e),
-            "timestamp": time.time(),
+            "timestamp": timestamp,
             "message": f"Error accessing locker: {e}",
         }
 
 
-def generate_rs485_frame(address: int, locker_number: int) -> str:
+# Frame layout: 5A5A | 00 | ADDRESS | 0004 | 0001 | LOCKER_NUMBER | CHECKSUM
+_FRAME_STRUCT = struct.Struct(">HBBHHBB")
+
+
+def _build_frame_bytes(address: int, locker_number: int) -> bytes:
     """
-    Generate RS485 protocol frame for locker control
+    Build the RS485 protocol frame for locker control
 
     Protocol: 5A5A 00 [ADDRESS] 00 04 00 01 [LOCKER_NUMBER] [CHECKSUM]
 
@@ -382,7 +598,7 @@ def generate_rs485_frame(address: int, locker_number: int) -> str:
         locker_number: Number of locker (1-24)
 
     Returns:
-        Hex string representing the complete frame
+        The complete 10-byte frame, ready to write to the serial port
     """
     # Protocol structure:
     # Start frame: 5A5A (fixed)
@@ -395,41 +611,82 @@ def generate_rs485_frame(address: int, locker_number: int) -> str:
     # Number of locker: [LOCKER_NUMBER] (1-24)
     # Checksum: XOR of all previous octets
 
-    # Validate inputs
-    if not (0 <= address <= 31):
-        raise ValueError("Address must be between 0 and 31")
-    if not (1 <= locker_number <= 24):
+    # XOR of all octets - the fixed ones reduce to 0x05
+    checksum = 0x05 ^ address ^ locker_number
+    return _FRAME_STRUCT.pack(
+        0x5A5A, 0x00, address, 0x0004, 0x0001, locker_number, checksum
+    )
+
+
+# Every valid frame (32 addresses x 24 lockers), built once at import
+_FRAMES: Dict[Tuple[int, int], bytes] = {
+    (address, locker_number): _build_frame_bytes(address, locker_number)
+    for address in range(32)
+    for locker_number in range(1, 25)
+}
+
+
+def generate_rs485_frame_bytes(address: int, locker_number: int) -> bytes:
+    """
+    Generate RS485 protocol frame for locker control
+
+    Args:
+        address: Address card (0-31 dipswitch)
+        locker_number: Number of locker (1-24)
+
+    Returns:
+        The complete 10-byte frame, ready to write to the serial port
+    """
+    frame = _FRAMES.get((address, locker_number))
+    if frame is None:
+        if not (0 <= address <= 31):
+            raise ValueError("Address must be between 0 and 31")
         raise ValueError("Locker number must be between 1 and 24")
+    return frame
 
-    # Build frame octets
-    frame_octets = [
-        0x5A,  # Start frame high byte
-        0x5A,  # Start frame low byte
-        0x00,  # Reserved
-        address,  # Address card (0-31)
-        0x00,  # Reserved
-        0x04,  # Reserved
-        0x00,  # Reserved
-        0x01,  # Reserved
-        locker_number,  # Number of locker (0-24)
-    ]
 
-    # Calculate checksum (XOR of all octets)
-    checksum = 0
-    for octet in frame_octets:
-        checksum ^= octet
+def generate_rs485_frame(address: int, locker_number: int) -> str:
+    """
+    Generate RS485 protocol frame for locker control as a hex string
 
-    # Add checksum to frame
-    frame_octets.append(checksum)
+    Args:
+        address: Address card (0-31 dipswitch)
+        locker_number: Number of locker (1-24)
 
-    # Convert to hex string (no spaces)
-    frame_hex = "".join([f"{octet:02X}" for octet in frame_octets])
+    Returns:
+        Hex string representing the complete frame (for display and logs)
+    """
+    return generate_rs485_frame_bytes(address, locker_number).hex().upper()
+
+
+# The fallback locker_id -> (address, locker_number) mapping repeats every
+# lcm(32, 24) = 96 ids, so one small table covers every id
+_ID_PERIOD = 96
+_ID_TO_FRAME: Tuple[Tuple[int, int, bytes], ...] = tuple(
+    (offset % 32, (offset % 24) + 1, _FRAMES[(offset % 32, (offset % 24) + 1)])
+    for offset in range(_ID_PERIOD)
+)
+
+
+def _default_locker_frame(locker_id: int) -> Tuple[int, int, bytes]:
+    """Return (address, locker_number, frame) for the fallback id mapping"""
+    return _ID_TO_FRAME[(locker_id - 1) % _ID_PERIOD]
 
-    logger.info(
-        f"Generated RS485 frame: {frame_hex} (Address: {address}, Locker: {locker_number}, Checksum: {checksum:02X})"
-    )
 
-    return frame_hex
+def generate_rs485_frames_bulk(pairs: List[Tuple[int, int]]) -> List[str]:
+    """
+    Generate RS485 frames for many (address, locker_number) pairs at once
+
+    Args:
+        pairs: Sequence of (address, locker_number) tuples
+
+    Returns:
+        List of hex strings, one per pair, identical to generate_rs485_frame
+    """
+    return [
+        generate_rs485_frame_bytes(address, locker_number).hex().upper()
+        for address, locker_number in pairs
+    ]
 
 
 def generate_locker_command_frame(locker_id: int, action: str = "open") -> str:
@@ -445,8 +702,7 @@ def generate_locker_command_frame(locker_id: int, action: str = "open") -> str:
     """
     # For now, we'll use a simple mapping
     # In a real implementation, you'd get the RS485 address and locker number from the database
-    address = (locker_id - 1) % 32  # Dipswitch 0-31
-    locker_number = ((locker_id - 1) % 24) + 1  # Locker 1-24
+    address, locker_number, _ = _default_locker_frame(locker_id)
 
     frame = generate_rs485_frame(address, locker_number)
 